@@ -27,7 +27,8 @@ try:
         generate_universal_cover_letter, 
         generate_universal_email,
         generate_universal_linkedin_messages,
-        save_universal_package
+        save_universal_package,
+        configure_logging
     )
 except ImportError:
     # Fallback to direct imports for testing
@@ -300,6 +301,7 @@ def main():
     parser.add_argument('--interactive', action='store_true', help='Interactive mode')
     
     args = parser.parse_args()
+    configure_logging()
     
     generator = UnifiedApplicationGenerator()
     
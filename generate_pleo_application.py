@@ -6,10 +6,61 @@ Creates resume, cover letter, email, and LinkedIn messages for Pleo Senior Produ
 
 import os
 import sys
+import copy
 import json
-from pathlib import Path
+import zipfile
+from functools import lru_cache
+from string import Template
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+PLEO_SUMMARY_TEMPLATE = Template("""# Pleo Senior Product Manager - User & Controls Application Package
+
+**Generated:** $generated
+**Company:** Pleo
+**Role:** Senior Product Manager - User & Controls
+**Location:** Remote (Netherlands/Europe)
+**Focus:** Fintech, Spend Management, User Enablement
+**Team Size:** 850+ employees from 100+ nations
+
+## Key Alignments:
+
+$alignments
+
+## Product Focus Areas:
+
+$focus_areas
+
+## Pleo Values & Culture Alignment:
+
+$values
+
+## Growth & Business Impact:
+
+$impacts
+
+## Package Contents:
+
+- ✅ Resume tailored to user management and spend controls expertise
+- ✅ Cover letter emphasizing finance/HR empathy and growth mindset
+- ✅ Professional application email highlighting Pleo mission alignment
+- ✅ LinkedIn outreach package with Danish work culture appreciation
+- ✅ JD analysis and alignment mapping for fintech domain
+
+## Remote Work & Culture Fit:
+- ✅ Netherlands remote work setup enthusiasm expressed
+- ✅ Danish work-life balance culture alignment highlighted
+- ✅ Cross-functional collaboration (>10 engineers) experience demonstrated
+- ✅ Transparency and innovation values alignment shown
+
+## Technical Domain Expertise:
+- ✅ User permissions and access controls systems
+- ✅ Spend policies and budget enforcement mechanisms
+- ✅ Approval workflows and process automation
+- ✅ HRIS integration and finance team collaboration
+- ✅ B2B SaaS growth and ARPA optimization
+""")
+
 def create_pleo_jd_analysis():
     """Create JD analysis for Pleo Senior Product Manager User & Controls role"""
     return {
@@ -187,12 +238,9 @@ Current Role: Senior Product Manager at COWRKS"""
 
     return email_content
 
-def generate_pleo_linkedin_messages():
-    """Generate LinkedIn messages for Pleo Senior Product Manager User & Controls role"""
-    
-    connection_request = """Hi! I saw the Senior Product Manager - User & Controls role at Pleo and I'm very interested. My experience building user management systems and spend controls for finance teams directly aligns with your user enablement mission. Would love to connect!"""
-    
-    direct_message = """Hello! I'm interested in the Senior Product Manager - User & Controls position at Pleo. I've spent the last 2 years building user management systems and spend control workflows that solve exactly the kind of inefficient process challenges you're revolutionizing.
+PLEO_CONNECTION_REQUEST = """Hi! I saw the Senior Product Manager - User & Controls role at Pleo and I'm very interested. My experience building user management systems and spend controls for finance teams directly aligns with your user enablement mission. Would love to connect!"""
+
+PLEO_DIRECT_MESSAGE = """Hello! I'm interested in the Senior Product Manager - User & Controls position at Pleo. I've spent the last 2 years building user management systems and spend control workflows that solve exactly the kind of inefficient process challenges you're revolutionizing.
 
 A few things I've done that might be relevant:
 • Built user permission frameworks for 600,000+ employees with complex spend approval workflows
@@ -207,157 +255,176 @@ I'm excited about the opportunity to work remotely from the Netherlands and cont
 
 Happy to discuss how my user management and spend control experience could contribute to your 2026 roadmap and continued market leadership!"""
 
-    return {
-        'connection_request': {
-            'content': connection_request,
-            'character_count': len(connection_request),
-            'limit': 300
-        },
-        'direct_message': {
-            'content': direct_message,
-            'character_count': len(direct_message),
-            'limit': 8000
-        }
+# Static content, so the character counts are computed once at import
+PLEO_LINKEDIN_MESSAGES = {
+    'connection_request': {
+        'content': PLEO_CONNECTION_REQUEST,
+        'character_count': len(PLEO_CONNECTION_REQUEST),
+        'limit': 300
+    },
+    'direct_message': {
+        'content': PLEO_DIRECT_MESSAGE,
+        'character_count': len(PLEO_DIRECT_MESSAGE),
+        'limit': 8000
     }
+}
+
+def generate_pleo_linkedin_messages():
+    """Generate LinkedIn messages for Pleo Senior Product Manager User & Controls role"""
+    
+    # A copy, so callers editing the messages can't change the shared constant
+    return copy.deepcopy(PLEO_LINKEDIN_MESSAGES)
 
-def save_pleo_application():
-    """Save complete Pleo application package"""
+def render_linkedin_package(linkedin_messages):
+    """Render the LinkedIn outreach package text for Pleo"""
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_dir = Path(f"output/Pleo_Senior_Product_Manager_User_Controls_{timestamp}")
-    output_dir.mkdir(parents=True, exist_ok=True)
+    conn = linkedin_messages['connection_request']
+    msg = linkedin_messages['direct_message']
     
-    print(f"💾 Saving Pleo application package to: {output_dir}")
+    return f"""LinkedIn Outreach Package for Pleo Senior Product Manager - User & Controls
+{"=" * 80}
+
+🤝 CONNECTION REQUEST:
+Characters: {conn['character_count']}/{conn['limit']}
+{"-" * 30}
+{conn['content']}
+
+💬 DIRECT MESSAGE:
+Characters: {msg['character_count']}/{msg['limit']}
+{"-" * 30}
+{msg['content']}
+
+📊 ANALYSIS:
+{"-" * 30}
+✅ Connection request under 300 character limit
+✅ Direct message optimized for Pleo's collaborative culture
+✅ User management and spend controls expertise highlighted
+✅ Finance and HR team empathy demonstrated
+✅ Pleo mission alignment and company knowledge shown
+✅ Netherlands remote work enthusiasm expressed
+✅ Danish work-life balance culture appreciation mentioned
+✅ ARPA growth and measurable outcomes emphasized
+✅ Cross-functional leadership experience showcased
+"""
+
+@lru_cache(maxsize=None)
+def generate_pleo_documents():
+    """Generate the Pleo resume, cover letter, email and LinkedIn package text
+    
+    The documents are static for this role, so batch runs that save the
+    package repeatedly in one process reuse the rendered strings.
+    """
+    return (
+        generate_pleo_resume(),
+        generate_pleo_cover_letter(),
+        generate_pleo_email(),
+        render_linkedin_package(generate_pleo_linkedin_messages()),
+    )
+
+def write_text_file(file_path, content):
+    """Write a single UTF-8 text file"""
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+def save_pleo_application(as_zip=False):
+    """Save complete Pleo application package
+    
+    With as_zip=True the package is written as a single .zip archive
+    instead of a directory of small files.
+    """
+    
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    package_name = f"Pleo_Senior_Product_Manager_User_Controls_{timestamp}"
+    output_dir = os.path.join("output", package_name)
     
     # Generate all content
-    resume = generate_pleo_resume()
-    cover_letter = generate_pleo_cover_letter()
-    email = generate_pleo_email()
-    linkedin_messages = generate_pleo_linkedin_messages()
+    resume, cover_letter, email, linkedin_package = generate_pleo_documents()
     jd_analysis = create_pleo_jd_analysis()
     
-    # Save resume
-    resume_file = output_dir / "vinesh_kumar_Pleo_resume_FINAL.txt"
-    with open(resume_file, 'w', encoding='utf-8') as f:
-        f.write(resume)
-    print(f"✅ Resume saved: {resume_file}")
+    # Save package summary
+    alignment_opportunities = jd_analysis['alignment_opportunities']
+    key_focus_areas = jd_analysis['key_focus_areas']
+    pleo_values_culture = jd_analysis['pleo_values_culture']
+    growth_and_business_impact = jd_analysis['growth_and_business_impact']
     
-    # Save cover letter
-    cover_file = output_dir / "vinesh_kumar_Pleo_cover_letter.txt"
-    with open(cover_file, 'w', encoding='utf-8') as f:
-        f.write(cover_letter)
-    print(f"✅ Cover letter saved: {cover_file}")
+    alignments = "\n".join(f"- ✅ {alignment}" for alignment in alignment_opportunities)
+    focus_areas = "\n".join(f"- 🎯 {area}" for area in key_focus_areas)
+    values = "\n".join(f"- 💼 {value}" for value in pleo_values_culture)
+    impacts = "\n".join(f"- 📈 {impact}" for impact in growth_and_business_impact)
     
-    # Save email
-    email_file = output_dir / "Pleo_application_email.txt"
-    with open(email_file, 'w', encoding='utf-8') as f:
-        f.write(email)
-    print(f"✅ Email saved: {email_file}")
+    summary = PLEO_SUMMARY_TEMPLATE.substitute(
+        generated=now.strftime('%B %d, %Y at %H:%M:%S'),
+        alignments=alignments,
+        focus_areas=focus_areas,
+        values=values,
+        impacts=impacts
+    )
     
-    # Save LinkedIn messages
-    linkedin_file = output_dir / "Pleo_linkedin_messages.txt"
-    with open(linkedin_file, 'w', encoding='utf-8') as f:
-        f.write("LinkedIn Outreach Package for Pleo Senior Product Manager - User & Controls\n")
-        f.write("=" * 80 + "\n\n")
-        
-        # Connection request
-        conn = linkedin_messages['connection_request']
-        f.write("🤝 CONNECTION REQUEST:\n")
-        f.write(f"Characters: {conn['character_count']}/{conn['limit']}\n")
-        f.write("-" * 30 + "\n")
-        f.write(conn['content'] + "\n\n")
-        
-        # Direct message
-        msg = linkedin_messages['direct_message']
-        f.write("💬 DIRECT MESSAGE:\n")
-        f.write(f"Characters: {msg['character_count']}/{msg['limit']}\n")
-        f.write("-" * 30 + "\n")
-        f.write(msg['content'] + "\n\n")
-        
-        f.write("📊 ANALYSIS:\n")
-        f.write("-" * 30 + "\n")
-        f.write("✅ Connection request under 300 character limit\n")
-        f.write("✅ Direct message optimized for Pleo's collaborative culture\n")
-        f.write("✅ User management and spend controls expertise highlighted\n")
-        f.write("✅ Finance and HR team empathy demonstrated\n")
-        f.write("✅ Pleo mission alignment and company knowledge shown\n")
-        f.write("✅ Netherlands remote work enthusiasm expressed\n")
-        f.write("✅ Danish work-life balance culture appreciation mentioned\n")
-        f.write("✅ ARPA growth and measurable outcomes emphasized\n")
-        f.write("✅ Cross-functional leadership experience showcased\n")
+    package_files = [
+        ("vinesh_kumar_Pleo_resume_FINAL.txt", resume, "Resume"),
+        ("vinesh_kumar_Pleo_cover_letter.txt", cover_letter, "Cover letter"),
+        ("Pleo_application_email.txt", email, "Email"),
+        ("Pleo_linkedin_messages.txt", linkedin_package, "LinkedIn messages"),
+        ("Pleo_jd_analysis.json", json.dumps(jd_analysis, indent=2, ensure_ascii=False), None),
+        ("APPLICATION_SUMMARY.md", summary, None),
+    ]
     
-    print(f"✅ LinkedIn messages saved: {linkedin_file}")
+    if as_zip:
+        archive_path = f"{output_dir}.zip"
+        os.makedirs("output", exist_ok=True)
+        print(f"💾 Saving Pleo application package to: {archive_path}")
+        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for filename, content, _ in package_files:
+                archive.writestr(f"{package_name}/{filename}", content)
+        return archive_path
     
-    # Save JD analysis
-    jd_file = output_dir / "Pleo_jd_analysis.json"
-    with open(jd_file, 'w', encoding='utf-8') as f:
-        json.dump(jd_analysis, f, indent=2, ensure_ascii=False)
+    os.makedirs(output_dir, exist_ok=True)
+    print(f"💾 Saving Pleo application package to: {output_dir}")
     
-    # Save package summary
-    summary_file = output_dir / "APPLICATION_SUMMARY.md"
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        f.write("# Pleo Senior Product Manager - User & Controls Application Package\n\n")
-        f.write(f"**Generated:** {datetime.now().strftime('%B %d, %Y at %H:%M:%S')}\n")
-        f.write("**Company:** Pleo\n")
-        f.write("**Role:** Senior Product Manager - User & Controls\n")
-        f.write("**Location:** Remote (Netherlands/Europe)\n")
-        f.write("**Focus:** Fintech, Spend Management, User Enablement\n")
-        f.write("**Team Size:** 850+ employees from 100+ nations\n\n")
-        f.write("## Key Alignments:\n\n")
-        for alignment in jd_analysis['alignment_opportunities']:
-            f.write(f"- ✅ {alignment}\n")
-        f.write("\n## Product Focus Areas:\n\n")
-        for area in jd_analysis['key_focus_areas']:
-            f.write(f"- 🎯 {area}\n")
-        f.write(f"\n## Pleo Values & Culture Alignment:\n\n")
-        for value in jd_analysis['pleo_values_culture']:
-            f.write(f"- 💼 {value}\n")
-        f.write(f"\n## Growth & Business Impact:\n\n")
-        for impact in jd_analysis['growth_and_business_impact']:
-            f.write(f"- 📈 {impact}\n")
-        f.write(f"\n## Package Contents:\n\n")
-        f.write(f"- ✅ Resume tailored to user management and spend controls expertise\n")
-        f.write(f"- ✅ Cover letter emphasizing finance/HR empathy and growth mindset\n") 
-        f.write(f"- ✅ Professional application email highlighting Pleo mission alignment\n")
-        f.write(f"- ✅ LinkedIn outreach package with Danish work culture appreciation\n")
-        f.write(f"- ✅ JD analysis and alignment mapping for fintech domain\n")
-        f.write(f"\n## Remote Work & Culture Fit:\n")
-        f.write(f"- ✅ Netherlands remote work setup enthusiasm expressed\n")
-        f.write(f"- ✅ Danish work-life balance culture alignment highlighted\n")
-        f.write(f"- ✅ Cross-functional collaboration (>10 engineers) experience demonstrated\n")
-        f.write(f"- ✅ Transparency and innovation values alignment shown\n")
-        f.write(f"\n## Technical Domain Expertise:\n")
-        f.write(f"- ✅ User permissions and access controls systems\n")
-        f.write(f"- ✅ Spend policies and budget enforcement mechanisms\n")
-        f.write(f"- ✅ Approval workflows and process automation\n")
-        f.write(f"- ✅ HRIS integration and finance team collaboration\n")
-        f.write(f"- ✅ B2B SaaS growth and ARPA optimization\n")
+    # The writes are independent and I/O bound, so overlap them in threads
+    with ThreadPoolExecutor(max_workers=len(package_files)) as executor:
+        futures = []
+        for filename, content, label in package_files:
+            file_path = os.path.join(output_dir, filename)
+            futures.append((executor.submit(write_text_file, file_path, content), file_path, label))
+        
+        for future, file_path, label in futures:
+            future.result()
+            if label:
+                print(f"✅ {label} saved: {file_path}")
     
-    return str(output_dir)
+    return output_dir
+
+PLEO_BANNER = "\n".join([
+    "🎯 PLEO SENIOR PRODUCT MANAGER - USER & CONTROLS APPLICATION GENERATOR",
+    "=" * 80,
+    "🏢 Company: Pleo",
+    "💼 Role: Senior Product Manager - User & Controls",
+    "📍 Location: Remote (Netherlands/Europe)",
+    "💰 Type: Full-time, Remote-first",
+    "🌐 Focus: Fintech, Spend Management, User Enablement",
+    "👥 Team: 850+ employees from 100+ nations",
+    "=" * 80,
+])
+
+PLEO_KEY_FEATURES = "\n".join([
+    "🎯 Key Features:",
+    "  ✅ User management and spend controls expertise highlighted",
+    "  ✅ Finance and HR team empathy demonstrated",
+    "  ✅ Pleo mission alignment and company culture appreciation shown",
+    "  ✅ Cross-functional leadership experience (15+ engineers)",
+    "  ✅ Netherlands remote work enthusiasm expressed",
+    "  ✅ Danish work-life balance culture alignment",
+    "  ✅ ARPA growth and measurable outcomes emphasized",
+    "  ✅ Complete LinkedIn outreach strategy with fintech focus",
+    "  ✅ B2B SaaS growth mindset and innovation drive",
+    "  ✅ User research and customer empathy track record",
+])
 
 if __name__ == "__main__":
-    print("🎯 PLEO SENIOR PRODUCT MANAGER - USER & CONTROLS APPLICATION GENERATOR")
-    print("=" * 80)
-    print("🏢 Company: Pleo")
-    print("💼 Role: Senior Product Manager - User & Controls")
-    print("📍 Location: Remote (Netherlands/Europe)")
-    print("💰 Type: Full-time, Remote-first")
-    print("🌐 Focus: Fintech, Spend Management, User Enablement")
-    print("👥 Team: 850+ employees from 100+ nations")
-    print("=" * 80)
+    print(PLEO_BANNER)
     
-    output_path = save_pleo_application()
+    output_path = save_pleo_application(as_zip="--zip" in sys.argv[1:])
     
-    print(f"\n🎉 PLEO APPLICATION PACKAGE COMPLETE!")
-    print(f"📁 Saved to: {output_path}")
-    print(f"\n🎯 Key Features:")
-    print(f"  ✅ User management and spend controls expertise highlighted")
-    print(f"  ✅ Finance and HR team empathy demonstrated") 
-    print(f"  ✅ Pleo mission alignment and company culture appreciation shown")
-    print(f"  ✅ Cross-functional leadership experience (15+ engineers)")
-    print(f"  ✅ Netherlands remote work enthusiasm expressed")
-    print(f"  ✅ Danish work-life balance culture alignment")
-    print(f"  ✅ ARPA growth and measurable outcomes emphasized")
-    print(f"  ✅ Complete LinkedIn outreach strategy with fintech focus")
-    print(f"  ✅ B2B SaaS growth mindset and innovation drive")
-    print(f"  ✅ User research and customer empathy track record")
\ No newline at end of file
+    print(f"\n🎉 PLEO APPLICATION PACKAGE COMPLETE!\n📁 Saved to: {output_path}\n\n{PLEO_KEY_FEATURES}")
@@ -4,49 +4,303 @@ Universal Application Generator
 Creates tailored application packages for any company/role using Adlina-style writing
 """
 
+from __future__ import annotations
+
+import atexit
 import json
+import logging
+import logging.handlers
 import os
+import queue
+import re
+import sys
 import argparse
+import asyncio
+import contextvars
+import multiprocessing
+import hashlib
+import random
+import time
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from string import Template
+from typing import TYPE_CHECKING, Dict, Any, List, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Progress messages; configure_logging() sends them to stdout for the command line
+logger = logging.getLogger("aply.universal")
+_log_listener = None
+
+# Set for the duration of a quiet bulk run; tasks and worker threads it starts
+# through asyncio.to_thread inherit the value
+_quiet_progress = contextvars.ContextVar("quiet_progress", default=False)
+
+class QuietProgressFilter(logging.Filter):
+    """Drop messages below WARNING logged on behalf of a quiet bulk run"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or not _quiet_progress.get()
+
+logger.addFilter(QuietProgressFilter())
+
+def configure_logging() -> None:
+    """Write progress messages to stdout through a queue and a listener thread
+    
+    Concurrent generations then don't contend on stdout. APLY_LOG_LEVEL sets
+    the level, e.g. WARNING to keep only warnings and errors; an unknown
+    level falls back to INFO. Later calls do nothing.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    level_name = os.environ.get("APLY_LOG_LEVEL", "INFO").upper()
+    level = logging.getLevelName(level_name)
+    logger.setLevel(level if isinstance(level, int) else logging.INFO)
+    logger.propagate = False
+    
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter("%(message)s"))
+    _log_listener = logging.handlers.QueueListener(log_queue, console_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
+    if not isinstance(level, int):
+        logger.warning(f"⚠️ Unknown APLY_LOG_LEVEL {level_name!r}, using INFO")
+
+# The generator modules pull in the LLM SDKs and build a global LLMService on
+# import, so they are imported where first used; --help and sibling scripts
+# importing helpers from here stay fast
+if TYPE_CHECKING:
+    from modules.llm_service import LLMService, LLMResponse
+    from modules.real_user_data_extractor import RealUserDataExtractor
+
+@lru_cache(maxsize=1)
+def get_llm_service() -> LLMService:
+    """Shared LLMService so clients and the response cache load once per process"""
+    from modules.llm_service import LLMService
+    return LLMService()
+
+@lru_cache(maxsize=1)
+def get_user_data() -> Tuple[RealUserDataExtractor, Dict[str, Any]]:
+    """Shared user data extractor and its extracted profile"""
+    from modules.real_user_data_extractor import RealUserDataExtractor
+    user_extractor = RealUserDataExtractor()
+    return user_extractor, user_extractor.extract_vinesh_data()
+
+@lru_cache(maxsize=None)
+def get_currency_info(country: str) -> Dict[str, Any]:
+    """Currency details for a target country, falling back to the default currency"""
+    user_extractor, _ = get_user_data()
+    return user_extractor.currency_conversions.get(country.lower(), user_extractor.currency_conversions['default'])
+
+_resume_generators = threading.local()
+
+def get_resume_generator():
+    """EnhancedFactAwareGenerator for the calling thread
+    
+    Its BrutalWorkflowValidator records the steps of the run in progress, so
+    applications generated concurrently must not share one generator. Each
+    worker thread builds its own on first use and reuses it for later runs.
+    """
+    generator = getattr(_resume_generators, 'generator', None)
+    if generator is None:
+        from modules.enhanced_fact_aware_generator import EnhancedFactAwareGenerator
+        generator = EnhancedFactAwareGenerator(
+            ats_optimization_enabled=True,
+            target_ats_score=85.0,
+            enable_brutal_validation=True
+        )
+        _resume_generators.generator = generator
+    return generator
+
+@lru_cache(maxsize=1)
+def get_linkedin_generator():
+    """Shared DynamicEmailLinkedInGenerator"""
+    from modules.dynamic_email_linkedin_generator import DynamicEmailLinkedInGenerator
+    return DynamicEmailLinkedInGenerator()
+
+@lru_cache(maxsize=128)
+def get_style_prompt(role_context: str = "") -> str:
+    """Adlina style prompt, built once per role context"""
+    from modules.adlina_style_guide import AdlinaStyleGuide
+    return AdlinaStyleGuide.generate_style_prompt(role_context)
+
+SAFE_NAME_TABLE = str.maketrans({" ": "_", "/": "_"})
+
+@lru_cache(maxsize=None)
+def safe_name(value: str) -> str:
+    """Filesystem-safe form of a company or role name"""
+    return value.translate(SAFE_NAME_TABLE)
+
+COVER_LETTER_PROMPT_TEMPLATE = Template("""
+Write an authentic, conversational cover letter for Vinesh Kumar applying to ${company}.
+
+AUTHENTIC WRITING STYLE - FOLLOW THESE PATTERNS:
+✅ DIRECT OPENING: "Dear Hiring Manager, I'm interested in the ${role} role at ${company} in ${location}."
+✅ CREDIBILITY STATEMENT: "I spent the last two years scaling COWRKS' food platform from 1,330 to 30,000+ daily orders (22.5X growth, ${currency_symbol}20M+ GMV)."
+✅ NATURAL CONNECTION: "The [specific challenge/complexity] sounds a lot like what you're managing" or "is exactly the kind of problem I dig into"
+✅ CASUAL BULLETS: "A few things I've done that might be relevant:"
+✅ AUTHENTIC INTEREST: "What draws me to ${company}: [specific reason about the company/challenge]"
+✅ SIMPLE CLOSING: "Happy to discuss how my experience maps to what you're building."
+
+❌ FORBIDDEN CORPORATE CLICHÉS:
+- "I am writing to express my interest"
+- "I am confident that my experience"
+- "I would welcome the opportunity" 
+- "Thank you for considering my application"
+- "I look forward to hearing from you"
+
+COMPANY-SPECIFIC CONNECTION:
+Company: ${company}
+Role: ${role}
+Location: ${location}
+
+REAL ACHIEVEMENTS (with specific numbers):
+• Scaled F&B platform from 1,330 to 30,000+ daily orders (22.5X growth, ${currency_symbol}20M+ GMV)
+• Increased NPS from 73% to 91% by fixing the friction points customers actually cared about
+• Automated contract workflows (42 days → 10 minutes) using AI, which freed up teams to focus on harder problems
+• Built operations layer for 30K+ daily orders across 24 locations
+
+STRUCTURE:
+1. Direct opening with role interest
+2. Quick credibility with F&B platform metrics
+3. Connection to company's specific challenges
+4. "A few things I've done that might be relevant:" + 3 bullet points with real numbers
+5. "What draws me to [Company]:" + specific reason
+6. "[Location] seems like the right place to keep working on this problem."
+7. "Happy to discuss how my experience maps to what you're building."
+
+TONE: Conversational, confident but not arrogant. Sounds like a real person wrote it.
+LENGTH: Under 250 words
+CURRENCY: Use ${currency_symbol} for all amounts
+
+PERSONAL SIGNATURE:
+Best,
+${user_name}
+""")
+
+EMAIL_PROMPT_TEMPLATE = Template("""
+Write a professional application email for Vinesh Kumar applying to ${company}.
+
+${style_prompt}
+
+EMAIL DETAILS:
+To: Hiring Team at ${company}
+Subject: Application for ${role} - ${location} (Vinesh Kumar)
+
+KEY POINTS TO INCLUDE:
+• 6+ years product management with F&B platform specialization
+• Scaled platform across 24 locations serving 600,000+ users  
+• Generated €20-22M annual GMV through product operations
+• Expertise directly relevant to ${role} role
+• Interest in ${location} opportunity
+
+PERSONAL INFO:
+Name: ${user_name}
+Email: ${user_email}
+Phone: ${user_phone}
+Current Role: Senior Product Manager at COWRKS
+
+TONE: Professional but personable, showing specific company interest
+LENGTH: 150-200 words maximum
+FORMAT: Business email with clear subject line and call-to-action
+""")
 
-from modules.enhanced_fact_aware_generator import EnhancedFactAwareGenerator
-from modules.real_user_data_extractor import RealUserDataExtractor
-from modules.llm_service import LLMService
-from modules.adlina_style_guide import AdlinaStyleGuide
-from modules.dynamic_email_linkedin_generator import DynamicEmailLinkedInGenerator
+# Output budgets sized to the length each prompt asks for (cover letter under
+# 250 words, email 150-200 words) with headroom for the greeting and signature
+COVER_LETTER_MAX_TOKENS = 600
+EMAIL_MAX_TOKENS = 500
+
+# Failures that will not go away by retrying (e.g. missing API keys)
+NON_RETRYABLE_LLM_ERRORS = ('not initialized',)
+
+def call_llm_with_retry(llm_service: LLMService, max_attempts: int = 4,
+                        base_delay: float = 0.5, **call_kwargs) -> LLMResponse:
+    """Call the LLM, retrying transient failures with exponential backoff and jitter
+    
+    LLMService.call_llm reports API errors as unsuccessful responses, so both
+    those and raised exceptions are retried. The last response is returned
+    (or the last exception re-raised) once attempts run out.
+    """
+    
+    for attempt in range(max_attempts):
+        try:
+            response = llm_service.call_llm(**call_kwargs)
+        except Exception as e:
+            if attempt == max_attempts - 1:
+                raise
+            logger.warning(f"⚠️ LLM call raised {e}, retrying ({attempt + 1}/{max_attempts - 1})")
+        else:
+            error = response.error_message or ''
+            if response.success or attempt == max_attempts - 1 or \
+                    any(marker in error for marker in NON_RETRYABLE_LLM_ERRORS):
+                return response
+            logger.warning(f"⚠️ LLM call failed ({error}), retrying ({attempt + 1}/{max_attempts - 1})")
+        
+        time.sleep(base_delay * 2 ** attempt + random.uniform(0, 0.1))
+
+# Length of the JD excerpt kept in extracted_info; the full text stays in original_jd
+JD_PREVIEW_CHARS = 500
+
+DEFAULT_REQUIREMENTS = (
+    'Product Management experience',
+    'Cross-functional collaboration',
+    'Data-driven decision making',
+    'Strategic thinking',
+    'Customer-centric approach'
+)
+
+DEFAULT_FOCUS_AREAS = (
+    'Product strategy and execution',
+    'Team leadership and stakeholder management',
+    'Process optimization and automation',
+    'Business impact and growth metrics'
+)
+
+# Candidate strengths mapped to what most product roles look for
+ALIGNMENT_OPPORTUNITIES = (
+    'F&B platform experience → Product operations',
+    'Multi-market scaling → Business growth',
+    'AI/automation expertise → Technical innovation',
+    'Cross-functional leadership → Team collaboration',
+    '€20-22M revenue generation → Business impact'
+)
 
 def create_universal_jd_analysis(company: str, role: str, location: str, jd_text: str, 
                                requirements: list = None, focus_areas: list = None) -> Dict[str, Any]:
     """Create JD analysis for any company/role"""
     
     # Parse basic info
+    preview = jd_text if len(jd_text) <= JD_PREVIEW_CHARS else jd_text[:JD_PREVIEW_CHARS] + "..."
     extracted_info = {
         'company': company,
         'role_title': role,
         'location': location,
-        'original_jd': jd_text[:500] + "..." if len(jd_text) > 500 else jd_text
+        'company_slug': company.lower(),
+        'company_safe': safe_name(company),
+        'role_safe': safe_name(role),
+        'original_jd': preview
     }
     
     # Default requirements if not provided
     if not requirements:
-        requirements = [
-            'Product Management experience',
-            'Cross-functional collaboration',
-            'Data-driven decision making',
-            'Strategic thinking',
-            'Customer-centric approach'
-        ]
+        requirements = list(DEFAULT_REQUIREMENTS)
     
     # Default focus areas if not provided
     if not focus_areas:
-        focus_areas = [
-            'Product strategy and execution',
-            'Team leadership and stakeholder management',
-            'Process optimization and automation',
-            'Business impact and growth metrics'
-        ]
+        focus_areas = list(DEFAULT_FOCUS_AREAS)
     
     return {
         'extracted_info': extracted_info,
@@ -56,188 +310,152 @@ def create_universal_jd_analysis(company: str, role: str, location: str, jd_text
             'nice_to_have': focus_areas
         },
         'key_focus_areas': focus_areas,
-        'alignment_opportunities': [
-            'F&B platform experience → Product operations',
-            'Multi-market scaling → Business growth',
-            'AI/automation expertise → Technical innovation',
-            'Cross-functional leadership → Team collaboration',
-            '€20-22M revenue generation → Business impact'
-        ],
+        'alignment_opportunities': list(ALIGNMENT_OPPORTUNITIES),
         'original_jd': jd_text
     }
 
+# Text between the PROFESSIONAL SUMMARY heading and the next EXPERIENCE heading,
+# without surrounding whitespace
+SUMMARY_SECTION_PATTERN = re.compile(r'PROFESSIONAL SUMMARY\s*(.*?)\s*EXPERIENCE', re.DOTALL)
+
+def validate_resume_summary(content: str) -> None:
+    """Extract the professional summary from a resume and check it against Adlina style"""
+    
+    from modules.adlina_style_guide import AdlinaStyleGuide
+    
+    summary_match = SUMMARY_SECTION_PATTERN.search(content)
+    if summary_match:
+        summary = summary_match.group(1)
+        adlina_validation = AdlinaStyleGuide.validate_summary(summary)
+        
+        if not adlina_validation['is_valid']:
+            logger.warning(f"⚠️ Adlina style issues: {adlina_validation['issues']}")
+        else:
+            logger.info("✅ Summary passes Adlina style validation")
+
 def generate_universal_resume(jd_analysis: Dict[str, Any], country: str = "netherlands") -> Dict[str, Any]:
     """Generate resume using Adlina style for any company"""
     
-    print(f"📄 Generating {jd_analysis['extracted_info']['company']} Resume...")
+    logger.info(f"📄 Generating {jd_analysis['extracted_info']['company']} Resume...")
     
-    # Initialize with Adlina style validation
-    generator = EnhancedFactAwareGenerator(
-        ats_optimization_enabled=True,
-        target_ats_score=85.0,
-        enable_brutal_validation=True
-    )
+    # Initialized with Adlina style validation
+    generator = get_resume_generator()
     
     # Generate with specific styling
     results = generator.generate_comprehensive_resume(jd_analysis, country=country)
     
     if 'resume_generation' in results and 'content' in results['resume_generation']:
-        print("✅ Resume generated successfully")
+        logger.info("✅ Resume generated successfully")
         
         # Validate against Adlina style
-        content = results['resume_generation']['content']
-        
-        # Extract and validate summary
-        summary_start = content.find('PROFESSIONAL SUMMARY')
-        if summary_start != -1:
-            summary_end = content.find('EXPERIENCE', summary_start)
-            if summary_end != -1:
-                summary = content[summary_start:summary_end].replace('PROFESSIONAL SUMMARY', '').strip()
-                adlina_validation = AdlinaStyleGuide.validate_summary(summary)
-                
-                if not adlina_validation['is_valid']:
-                    print(f"⚠️ Adlina style issues: {adlina_validation['issues']}")
-                else:
-                    print("✅ Summary passes Adlina style validation")
+        validate_resume_summary(results['resume_generation']['content'])
         
         return results
     else:
-        print("❌ Resume generation failed")
+        logger.error("❌ Resume generation failed")
         return None
 
-def generate_universal_cover_letter(jd_analysis: Dict[str, Any], country: str = "netherlands") -> str:
-    """Generate cover letter for any company using Adlina principles"""
+def build_cover_letter_prompt(jd_analysis: Dict[str, Any], country: str = "netherlands") -> str:
+    """Cover letter prompt for a JD analysis and target country"""
     
-    print(f"📝 Generating {jd_analysis['extracted_info']['company']} Cover Letter...")
-    
-    llm_service = LLMService()
-    user_extractor = RealUserDataExtractor()
-    user_data = user_extractor.extract_vinesh_data()
+    extracted_info = jd_analysis['extracted_info']
+    _, user_data = get_user_data()
     
     # Get target country currency
-    currency_info = user_extractor.currency_conversions.get(country.lower(), user_extractor.currency_conversions['default'])
+    currency_info = get_currency_info(country)
     
-    cover_letter_prompt = f"""
-Write an authentic, conversational cover letter for Vinesh Kumar applying to {jd_analysis['extracted_info']['company']}.
-
-AUTHENTIC WRITING STYLE - FOLLOW THESE PATTERNS:
-✅ DIRECT OPENING: "Dear Hiring Manager, I'm interested in the {jd_analysis['extracted_info']['role_title']} role at {jd_analysis['extracted_info']['company']} in {jd_analysis['extracted_info']['location']}."
-✅ CREDIBILITY STATEMENT: "I spent the last two years scaling COWRKS' food platform from 1,330 to 30,000+ daily orders (22.5X growth, {currency_info['symbol']}20M+ GMV)."
-✅ NATURAL CONNECTION: "The [specific challenge/complexity] sounds a lot like what you're managing" or "is exactly the kind of problem I dig into"
-✅ CASUAL BULLETS: "A few things I've done that might be relevant:"
-✅ AUTHENTIC INTEREST: "What draws me to {jd_analysis['extracted_info']['company']}: [specific reason about the company/challenge]"
-✅ SIMPLE CLOSING: "Happy to discuss how my experience maps to what you're building."
-
-❌ FORBIDDEN CORPORATE CLICHÉS:
-- "I am writing to express my interest"
-- "I am confident that my experience"
-- "I would welcome the opportunity" 
-- "Thank you for considering my application"
-- "I look forward to hearing from you"
-
-COMPANY-SPECIFIC CONNECTION:
-Company: {jd_analysis['extracted_info']['company']}
-Role: {jd_analysis['extracted_info']['role_title']}
-Location: {jd_analysis['extracted_info']['location']}
-
-REAL ACHIEVEMENTS (with specific numbers):
-• Scaled F&B platform from 1,330 to 30,000+ daily orders (22.5X growth, {currency_info['symbol']}20M+ GMV)
-• Increased NPS from 73% to 91% by fixing the friction points customers actually cared about
-• Automated contract workflows (42 days → 10 minutes) using AI, which freed up teams to focus on harder problems
-• Built operations layer for 30K+ daily orders across 24 locations
-
-STRUCTURE:
-1. Direct opening with role interest
-2. Quick credibility with F&B platform metrics
-3. Connection to company's specific challenges
-4. "A few things I've done that might be relevant:" + 3 bullet points with real numbers
-5. "What draws me to [Company]:" + specific reason
-6. "[Location] seems like the right place to keep working on this problem."
-7. "Happy to discuss how my experience maps to what you're building."
+    return COVER_LETTER_PROMPT_TEMPLATE.substitute(
+        company=extracted_info['company'],
+        role=extracted_info['role_title'],
+        location=extracted_info['location'],
+        currency_symbol=currency_info['symbol'],
+        user_name=user_data['personal_info']['name']
+    )
 
-TONE: Conversational, confident but not arrogant. Sounds like a real person wrote it.
-LENGTH: Under 250 words
-CURRENCY: Use {currency_info['symbol']} for all amounts
+def build_email_prompt(jd_analysis: Dict[str, Any]) -> str:
+    """Application email prompt for a JD analysis"""
+    
+    extracted_info = jd_analysis['extracted_info']
+    _, user_data = get_user_data()
+    
+    return EMAIL_PROMPT_TEMPLATE.substitute(
+        company=extracted_info['company'],
+        role=extracted_info['role_title'],
+        location=extracted_info['location'],
+        style_prompt=get_style_prompt(),
+        user_name=user_data['personal_info']['name'],
+        user_email=user_data['personal_info']['email'],
+        user_phone=user_data['personal_info']['phone']
+    )
 
-PERSONAL SIGNATURE:
-Best,
-{user_data['personal_info']['name']}
-"""
+def generate_universal_cover_letter(jd_analysis: Dict[str, Any], country: str = "netherlands",
+                                    use_cache: bool = True) -> str:
+    """Generate cover letter for any company using Adlina principles"""
+    
+    extracted_info = jd_analysis['extracted_info']
+    logger.info(f"📝 Generating {extracted_info['company']} Cover Letter...")
+    
+    llm_service = get_llm_service()
+    cover_letter_prompt = build_cover_letter_prompt(jd_analysis, country)
 
     try:
-        response = llm_service.call_llm(
+        response = call_llm_with_retry(
+            llm_service,
             prompt=cover_letter_prompt,
-            task_type=f"{jd_analysis['extracted_info']['company'].lower()}_cover_letter",
+            task_type=f"{extracted_info['company_slug']}_cover_letter",
+            use_cache=use_cache,
             temperature=0.3,
-            max_tokens=2000
+            max_tokens=COVER_LETTER_MAX_TOKENS
         )
         
-        print("✅ Cover letter generated successfully")
+        if not response.success:
+            logger.error(f"❌ Cover letter generation failed: {response.error_message}")
+            return None
+        
+        logger.info("✅ Cover letter generated successfully")
         return response.content
         
     except Exception as e:
-        print(f"❌ Cover letter generation failed: {str(e)}")
+        logger.error(f"❌ Cover letter generation failed: {str(e)}")
         return None
 
-def generate_universal_email(jd_analysis: Dict[str, Any]) -> str:
+def generate_universal_email(jd_analysis: Dict[str, Any], use_cache: bool = True) -> str:
     """Generate application email for any company"""
     
-    print(f"📧 Generating {jd_analysis['extracted_info']['company']} Email...")
-    
-    llm_service = LLMService()
-    user_extractor = RealUserDataExtractor()
-    user_data = user_extractor.extract_vinesh_data()
+    extracted_info = jd_analysis['extracted_info']
+    logger.info(f"📧 Generating {extracted_info['company']} Email...")
     
-    email_prompt = f"""
-Write a professional application email for Vinesh Kumar applying to {jd_analysis['extracted_info']['company']}.
-
-{AdlinaStyleGuide.generate_style_prompt()}
-
-EMAIL DETAILS:
-To: Hiring Team at {jd_analysis['extracted_info']['company']}
-Subject: Application for {jd_analysis['extracted_info']['role_title']} - {jd_analysis['extracted_info']['location']} (Vinesh Kumar)
-
-KEY POINTS TO INCLUDE:
-• 6+ years product management with F&B platform specialization
-• Scaled platform across 24 locations serving 600,000+ users  
-• Generated €20-22M annual GMV through product operations
-• Expertise directly relevant to {jd_analysis['extracted_info']['role_title']} role
-• Interest in {jd_analysis['extracted_info']['location']} opportunity
-
-PERSONAL INFO:
-Name: {user_data['personal_info']['name']}
-Email: {user_data['personal_info']['email']}
-Phone: {user_data['personal_info']['phone']}
-Current Role: Senior Product Manager at COWRKS
-
-TONE: Professional but personable, showing specific company interest
-LENGTH: 150-200 words maximum
-FORMAT: Business email with clear subject line and call-to-action
-"""
+    llm_service = get_llm_service()
+    email_prompt = build_email_prompt(jd_analysis)
 
     try:
-        response = llm_service.call_llm(
+        response = call_llm_with_retry(
+            llm_service,
             prompt=email_prompt,
-            task_type=f"{jd_analysis['extracted_info']['company'].lower()}_email",
+            task_type=f"{extracted_info['company_slug']}_email",
+            use_cache=use_cache,
             temperature=0.3,
-            max_tokens=1000
+            max_tokens=EMAIL_MAX_TOKENS
         )
         
-        print("✅ Email generated successfully")
+        if not response.success:
+            logger.error(f"❌ Email generation failed: {response.error_message}")
+            return None
+        
+        logger.info("✅ Email generated successfully")
         return response.content
         
     except Exception as e:
-        print(f"❌ Email generation failed: {str(e)}")
+        logger.error(f"❌ Email generation failed: {str(e)}")
         return None
 
 def generate_universal_linkedin_messages(jd_analysis: Dict[str, Any], country: str = "netherlands") -> Dict[str, Any]:
     """Generate LinkedIn messages for any company using DynamicEmailLinkedInGenerator"""
     
-    print(f"💼 Generating {jd_analysis['extracted_info']['company']} LinkedIn Messages...")
+    logger.info(f"💼 Generating {jd_analysis['extracted_info']['company']} LinkedIn Messages...")
     
-    linkedin_generator = DynamicEmailLinkedInGenerator()
-    user_extractor = RealUserDataExtractor()
-    user_profile = user_extractor.extract_vinesh_data()
+    linkedin_generator = get_linkedin_generator()
+    _, user_profile = get_user_data()
     
     try:
         # Generate complete LinkedIn outreach package
@@ -246,108 +464,448 @@ def generate_universal_linkedin_messages(jd_analysis: Dict[str, Any], country: s
         )
         
         if 'error' not in linkedin_package:
-            print("✅ LinkedIn messages generated successfully")
+            logger.info("✅ LinkedIn messages generated successfully")
             return linkedin_package
         else:
-            print(f"❌ LinkedIn generation failed: {linkedin_package['error']}")
+            logger.error(f"❌ LinkedIn generation failed: {linkedin_package['error']}")
             return None
             
     except Exception as e:
-        print(f"❌ LinkedIn message generation failed: {str(e)}")
+        logger.error(f"❌ LinkedIn message generation failed: {str(e)}")
         return None
 
-def save_universal_package(company: str, role: str, resume_results: Dict, cover_letter: str, 
-                         email: str, linkedin_messages: Dict, jd_analysis: Dict) -> str:
-    """Save complete application package for any company"""
+PACKAGE_SECTION_MARKERS = ('===RESUME===', '===COVER_LETTER===', '===EMAIL===')
+
+PACKAGE_PROMPT_TEMPLATE = Template("""
+Write three application documents for Vinesh Kumar applying to ${company}.
+
+SHARED CONTEXT:
+Company: ${company}
+Role: ${role}
+Location: ${location}
+Currency: Use ${currency_symbol} for all amounts
+
+CANDIDATE RESUME (only source of facts):
+${user_resume_text}
+
+${constraints_prompt}
+
+${style_prompt}
+
+PERSONAL INFO:
+Name: ${user_name}
+Email: ${user_email}
+Phone: ${user_phone}
+Current Role: Senior Product Manager at COWRKS
+
+TASK 1 - RESUME:
+Plain-text resume with PROFESSIONAL SUMMARY, EXPERIENCE, EDUCATION and SKILLS sections, tailored to the ${role} role.
+
+TASK 2 - COVER LETTER:
+Conversational cover letter under 250 words. Direct opening ("I'm interested in the ${role} role at ${company}"),
+"A few things I've done that might be relevant:" with 3 bullets using real numbers,
+"What draws me to ${company}:" and close with "Happy to discuss how my experience maps to what you're building."
+Sign off with "Best,\n${user_name}".
+
+TASK 3 - EMAIL:
+Professional application email body, 150-200 words, showing specific interest in ${company} and ${location}, with a clear call-to-action.
+
+OUTPUT FORMAT:
+Output exactly three sections in this order, each starting with its marker on its own line and nothing else:
+${resume_marker}
+${cover_letter_marker}
+${email_marker}
+""")
+
+def generate_universal_package_single_call(jd_analysis: Dict[str, Any], country: str = "netherlands",
+                                           use_cache: bool = True):
+    """Generate resume, cover letter and email with one LLM call
+    
+    The shared context (company, role, candidate facts, style guide) is sent
+    once and the model returns the three documents between section markers.
+    Trades some per-document quality for a single round-trip.
+    """
+    
+    extracted_info = jd_analysis['extracted_info']
+    company = extracted_info['company']
+    role = extracted_info['role_title']
+    location = extracted_info['location']
+    
+    logger.info(f"📦 Generating {company} Resume, Cover Letter and Email in a single call...")
+    
+    llm_service = get_llm_service()
+    user_extractor, user_data = get_user_data()
+    currency_info = get_currency_info(country)
+    resume_marker, cover_letter_marker, email_marker = PACKAGE_SECTION_MARKERS
+    
+    package_prompt = PACKAGE_PROMPT_TEMPLATE.substitute(
+        company=company,
+        role=role,
+        location=location,
+        currency_symbol=currency_info['symbol'],
+        user_resume_text=user_extractor.user_resume_text,
+        constraints_prompt=user_extractor.create_llm_constraints_prompt(),
+        style_prompt=get_style_prompt(role),
+        user_name=user_data['personal_info']['name'],
+        user_email=user_data['personal_info']['email'],
+        user_phone=user_data['personal_info']['phone'],
+        resume_marker=resume_marker,
+        cover_letter_marker=cover_letter_marker,
+        email_marker=email_marker
+    )
+
+    response = call_llm_with_retry(
+        llm_service,
+        prompt=package_prompt,
+        task_type=f"{extracted_info['company_slug']}_package",
+        use_cache=use_cache,
+        temperature=0.3,
+        max_tokens=6000
+    )
+    
+    sections = split_package_sections(response.content)
+    resume_content = sections.get(resume_marker)
+    
+    resume_results = None
+    if resume_content:
+        logger.info("✅ Resume generated successfully")
+        validate_resume_summary(resume_content)
+        resume_results = {'resume_generation': {'content': resume_content}}
+    else:
+        logger.error("❌ Resume generation failed")
+    
+    cover_letter = sections.get(cover_letter_marker)
+    if cover_letter:
+        logger.info("✅ Cover letter generated successfully")
+    else:
+        logger.error("❌ Cover letter generation failed")
+    
+    email = sections.get(email_marker)
+    if email:
+        logger.info("✅ Email generated successfully")
+    else:
+        logger.error("❌ Email generation failed")
+    
+    return resume_results, cover_letter, email
+
+def split_package_sections(content: str) -> Dict[str, str]:
+    """Split a single-call package response into its marked sections"""
+    
+    sections = {}
+    current_marker = None
+    current_lines = []
+    
+    for line in (content or "").splitlines():
+        marker = line.strip()
+        if marker in PACKAGE_SECTION_MARKERS:
+            if current_marker:
+                sections[current_marker] = "\n".join(current_lines).strip()
+            current_marker = marker
+            current_lines = []
+        elif current_marker:
+            current_lines.append(line)
+    
+    if current_marker:
+        sections[current_marker] = "\n".join(current_lines).strip()
+    
+    return {marker: text for marker, text in sections.items() if text}
+
+async def generate_core_documents(jd_analysis: Dict[str, Any], country: str = "netherlands",
+                                  use_cache: bool = True):
+    """Generate resume, cover letter and email concurrently
+    
+    The three generations are independent LLM round-trips, so running them
+    in worker threads brings wall time down to roughly the slowest call.
+    """
+    
+    # Warm the shared service and user data before fanning out to threads
+    get_llm_service()
+    get_user_data()
+    
+    return await asyncio.gather(
+        asyncio.to_thread(generate_universal_resume, jd_analysis, country),
+        asyncio.to_thread(generate_universal_cover_letter, jd_analysis, country, use_cache),
+        asyncio.to_thread(generate_universal_email, jd_analysis, use_cache)
+    )
+
+async def generate_package_documents(jd_analysis: Dict[str, Any], country: str = "netherlands",
+                                     use_cache: bool = True, single_call: bool = False):
+    """Generate resume, cover letter, email and LinkedIn messages concurrently
+    
+    LinkedIn generation only depends on jd_analysis, so it runs alongside the
+    core documents instead of after them.
+    """
+    
+    if single_call:
+        core_documents = asyncio.to_thread(generate_universal_package_single_call,
+                                           jd_analysis, country, use_cache)
+    else:
+        core_documents = generate_core_documents(jd_analysis, country, use_cache)
+    
+    (resume_results, cover_letter, email), linkedin_messages = await asyncio.gather(
+        core_documents,
+        asyncio.to_thread(generate_universal_linkedin_messages, jd_analysis, country)
+    )
+    
+    return resume_results, cover_letter, email, linkedin_messages
+
+PACKAGE_INDEX_FILE = Path("output/.sig_index.json")
+_package_index_lock = threading.Lock()
+
+def package_signature(company: str, role: str, location: str, country: str,
+                      jd_text: str, requirements: list = None) -> str:
+    """Content signature for a set of generation inputs"""
+    inputs = repr((company, role, location, country, jd_text, tuple(requirements or ())))
+    return hashlib.blake2b(inputs.encode('utf-8'), digest_size=6).hexdigest()
+
+def required_package_files(company: str) -> list:
+    """Files a package directory must contain to count as complete"""
+    company_safe = safe_name(company)
+    return [
+        f"vinesh_kumar_{company_safe}_resume_FINAL.txt",
+        f"vinesh_kumar_{company_safe}_cover_letter.txt",
+        f"{company_safe}_application_email.txt",
+        f"{company_safe}_jd_analysis.json",
+        "APPLICATION_SUMMARY.md"
+    ]
+
+def load_package_index() -> Dict[str, str]:
+    """Load the signature → output directory index"""
+    if PACKAGE_INDEX_FILE.exists():
+        try:
+            with open(PACKAGE_INDEX_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    return {}
+
+def package_is_complete(package_path: str, company: str) -> bool:
+    """Whether a package directory or .zip archive holds every required file"""
+    path = Path(package_path)
+    
+    if path.suffix == ".zip":
+        if not path.is_file():
+            return False
+        try:
+            with zipfile.ZipFile(path) as archive:
+                names = set(archive.namelist())
+        except zipfile.BadZipFile:
+            return False
+        return all(f"{path.stem}/{name}" in names for name in required_package_files(company))
+    
+    return all((path / name).exists() for name in required_package_files(company))
+
+def find_existing_package(signature: str, company: str):
+    """Return the output path of a complete earlier package with this signature"""
+    with _package_index_lock:
+        package_dir = load_package_index().get(signature)
+    
+    if package_dir and package_is_complete(package_dir, company):
+        return package_dir
+    return None
+
+def record_package(signature: str, package_dir: str) -> None:
+    """Remember which output directory holds the package for a signature"""
+    with _package_index_lock:
+        index = load_package_index()
+        index[signature] = package_dir
+        PACKAGE_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(PACKAGE_INDEX_FILE, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(index, indent=2))
+
+def render_linkedin_package(company: str, role: str, linkedin_messages: Dict) -> str:
+    """Render the LinkedIn outreach package text"""
+    
+    parts = [f"LinkedIn Outreach Package for {company} {role}\n", "=" * 60 + "\n\n"]
+    
+    # Connection request
+    if 'linkedin_connection' in linkedin_messages:
+        conn = linkedin_messages['linkedin_connection']
+        parts.append("🤝 CONNECTION REQUEST:\n")
+        parts.append(f"Characters: {conn.get('character_count', 0)}/{300}\n")
+        parts.append("-" * 30 + "\n")
+        parts.append(conn.get('content', 'No content') + "\n\n")
+    
+    # Direct message
+    if 'linkedin_message' in linkedin_messages:
+        msg = linkedin_messages['linkedin_message']
+        parts.append("💬 DIRECT MESSAGE:\n")
+        parts.append(f"Characters: {msg.get('character_count', 0)}/{400}\n")
+        parts.append("-" * 30 + "\n")
+        parts.append(msg.get('content', 'No content') + "\n\n")
+    
+    # Email template (if included)
+    if 'email_template' in linkedin_messages:
+        email_template = linkedin_messages['email_template']
+        parts.append("📧 EMAIL TEMPLATE:\n")
+        parts.append("-" * 30 + "\n")
+        parts.append(f"Subject: {email_template.get('subject', 'No subject')}\n\n")
+        parts.append(f"Body:\n{email_template.get('body', 'No body')}\n\n")
+    
+    return "".join(parts)
+
+def dump_json(data: Dict[str, Any]) -> str:
+    """Serialize to indented UTF-8 JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+def write_text_file(file_path, content: str) -> None:
+    """Write a single UTF-8 text file"""
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+def prepare_universal_package(company: str, role: str, resume_results: Dict, cover_letter: str,
+                              email: str, linkedin_messages: Dict, jd_analysis: Dict) -> Tuple[Path, list]:
+    """Render every package file
+    
+    Returns the output directory path (not yet created) and a list of
+    (filename, content, label) entries; label is None for files that are
+    saved without a progress message.
+    """
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    company_safe = company.replace(" ", "_").replace("/", "_")
-    role_safe = role.replace(" ", "_").replace("/", "_")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    extracted_info = jd_analysis['extracted_info']
+    location = extracted_info['location']
+    company_safe = extracted_info.get('company_safe') or safe_name(company)
+    role_safe = extracted_info.get('role_safe') or safe_name(role)
     output_dir = Path(f"output/{company_safe}_{role_safe}_{timestamp}")
-    output_dir.mkdir(parents=True, exist_ok=True)
     
-    print(f"💾 Saving {company} application package to: {output_dir}")
+    # Render every artifact up front so the writes can run concurrently
+    package_files = []
     
-    # Save resume
     if resume_results and 'resume_generation' in resume_results:
-        resume_file = output_dir / f"vinesh_kumar_{company_safe}_resume_FINAL.txt"
-        with open(resume_file, 'w', encoding='utf-8') as f:
-            f.write(resume_results['resume_generation']['content'])
-        print(f"✅ Resume saved: {resume_file}")
+        package_files.append((f"vinesh_kumar_{company_safe}_resume_FINAL.txt",
+                              resume_results['resume_generation']['content'], "Resume"))
     
-    # Save cover letter
     if cover_letter:
-        cover_file = output_dir / f"vinesh_kumar_{company_safe}_cover_letter.txt"
-        with open(cover_file, 'w', encoding='utf-8') as f:
-            f.write(cover_letter)
-        print(f"✅ Cover letter saved: {cover_file}")
+        package_files.append((f"vinesh_kumar_{company_safe}_cover_letter.txt", cover_letter, "Cover letter"))
     
-    # Save email
     if email:
-        email_file = output_dir / f"{company_safe}_application_email.txt"
-        with open(email_file, 'w', encoding='utf-8') as f:
-            f.write(f"Subject: Application for {role} - {jd_analysis['extracted_info']['location']} (Vinesh Kumar)\n\n")
-            f.write(email)
-        print(f"✅ Email saved: {email_file}")
+        email_subject = f"Subject: Application for {role} - {location} (Vinesh Kumar)\n\n"
+        package_files.append((f"{company_safe}_application_email.txt", email_subject + email, "Email"))
     
-    # Save LinkedIn messages
     if linkedin_messages:
-        linkedin_file = output_dir / f"{company_safe}_linkedin_messages.txt"
-        with open(linkedin_file, 'w', encoding='utf-8') as f:
-            f.write(f"LinkedIn Outreach Package for {company} {role}\n")
-            f.write("=" * 60 + "\n\n")
-            
-            # Connection request
-            if 'linkedin_connection' in linkedin_messages:
-                conn = linkedin_messages['linkedin_connection']
-                f.write("🤝 CONNECTION REQUEST:\n")
-                f.write(f"Characters: {conn.get('character_count', 0)}/{300}\n")
-                f.write("-" * 30 + "\n")
-                f.write(conn.get('content', 'No content') + "\n\n")
-            
-            # Direct message
-            if 'linkedin_message' in linkedin_messages:
-                msg = linkedin_messages['linkedin_message']
-                f.write("💬 DIRECT MESSAGE:\n")
-                f.write(f"Characters: {msg.get('character_count', 0)}/{400}\n")
-                f.write("-" * 30 + "\n")
-                f.write(msg.get('content', 'No content') + "\n\n")
-            
-            # Email template (if included)
-            if 'email_template' in linkedin_messages:
-                email_template = linkedin_messages['email_template']
-                f.write("📧 EMAIL TEMPLATE:\n")
-                f.write("-" * 30 + "\n")
-                f.write(f"Subject: {email_template.get('subject', 'No subject')}\n\n")
-                f.write(f"Body:\n{email_template.get('body', 'No body')}\n\n")
+        package_files.append((f"{company_safe}_linkedin_messages.txt",
+                              render_linkedin_package(company, role, linkedin_messages), "LinkedIn messages"))
+    
+    package_files.append((f"{company_safe}_jd_analysis.json",
+                          dump_json(jd_analysis), None))
+    
+    alignments = "\n".join(f"- ✅ {alignment}" for alignment in jd_analysis['alignment_opportunities'])
+    summary = f"""# {company} {role} Application Package
+
+**Generated:** {now.strftime('%B %d, %Y at %H:%M:%S')}
+**Company:** {company}
+**Role:** {role}
+**Location:** {location}
+
+## Key Alignments:
+
+{alignments}
+
+## Generated with Adlina Style Guide
+- ✅ No generic language
+- ✅ Specific metrics integration
+- ✅ Action-focused content
+- ✅ Target country currency
+- ✅ RAG-based content only
+"""
+    package_files.append(("APPLICATION_SUMMARY.md", summary, None))
+    
+    return output_dir, package_files
+
+def write_package_zip(company: str, output_dir: Path, package_files: list) -> str:
+    """Write the package files into a single compressed archive next to output_dir"""
+    
+    archive_path = output_dir.parent / f"{output_dir.name}.zip"
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    logger.info(f"💾 Saving {company} application package to: {archive_path}")
+    
+    with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for filename, content, _ in package_files:
+            archive.writestr(f"{output_dir.name}/{filename}", content)
+    
+    return str(archive_path)
+
+def save_universal_package(company: str, role: str, resume_results: Dict, cover_letter: str, 
+                         email: str, linkedin_messages: Dict, jd_analysis: Dict, as_zip: bool = False) -> str:
+    """Save complete application package for any company
+    
+    With as_zip=True the package is written as a single .zip archive
+    instead of a directory of small files.
+    """
+    
+    output_dir, package_files = prepare_universal_package(
+        company, role, resume_results, cover_letter, email, linkedin_messages, jd_analysis
+    )
+    
+    if as_zip:
+        return write_package_zip(company, output_dir, package_files)
+    
+    output_dir.mkdir(parents=True, exist_ok=True)
+    logger.info(f"💾 Saving {company} application package to: {output_dir}")
+    
+    with ThreadPoolExecutor(max_workers=len(package_files)) as executor:
+        futures = []
+        for filename, content, label in package_files:
+            file_path = output_dir / filename
+            futures.append((executor.submit(write_text_file, file_path, content), file_path, label))
         
-        print(f"✅ LinkedIn messages saved: {linkedin_file}")
-    
-    # Save JD analysis
-    jd_file = output_dir / f"{company_safe}_jd_analysis.json"
-    with open(jd_file, 'w', encoding='utf-8') as f:
-        json.dump(jd_analysis, f, indent=2, ensure_ascii=False)
-    
-    # Save package summary
-    summary_file = output_dir / "APPLICATION_SUMMARY.md"
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        f.write(f"# {company} {role} Application Package\n\n")
-        f.write(f"**Generated:** {datetime.now().strftime('%B %d, %Y at %H:%M:%S')}\n")
-        f.write(f"**Company:** {company}\n")
-        f.write(f"**Role:** {role}\n")
-        f.write(f"**Location:** {jd_analysis['extracted_info']['location']}\n\n")
-        f.write("## Key Alignments:\n\n")
-        for alignment in jd_analysis['alignment_opportunities']:
-            f.write(f"- ✅ {alignment}\n")
-        f.write(f"\n## Generated with Adlina Style Guide\n")
-        f.write(f"- ✅ No generic language\n")
-        f.write(f"- ✅ Specific metrics integration\n") 
-        f.write(f"- ✅ Action-focused content\n")
-        f.write(f"- ✅ Target country currency\n")
-        f.write(f"- ✅ RAG-based content only\n")
+        for future, file_path, label in futures:
+            future.result()
+            if label:
+                logger.info(f"✅ {label} saved: {file_path}")
     
     return str(output_dir)
 
+async def save_universal_package_async(company: str, role: str, resume_results: Dict, cover_letter: str,
+                                       email: str, linkedin_messages: Dict, jd_analysis: Dict,
+                                       as_zip: bool = False) -> str:
+    """Async variant of save_universal_package
+    
+    Each file is written in a worker thread and the writes are awaited together,
+    so slow filesystems (network mounts, synced folders) overlap their
+    latency without blocking other applications in the same loop.
+    """
+    
+    output_dir, package_files = await asyncio.to_thread(
+        prepare_universal_package,
+        company, role, resume_results, cover_letter, email, linkedin_messages, jd_analysis
+    )
+    
+    if as_zip:
+        return await asyncio.to_thread(write_package_zip, company, output_dir, package_files)
+    
+    output_dir.mkdir(parents=True, exist_ok=True)
+    logger.info(f"💾 Saving {company} application package to: {output_dir}")
+    
+    await asyncio.gather(*(
+        asyncio.to_thread(write_text_file, output_dir / filename, content)
+        for filename, content, _ in package_files
+    ))
+    
+    for filename, _, label in package_files:
+        if label:
+            logger.info(f"✅ {label} saved: {output_dir / filename}")
+    
+    return str(output_dir)
+
+# Job descriptions are a few thousand characters; anything past this is appended noise
+MAX_JD_CHARS = 1_000_000
+
+def read_jd_file(jd_file: str) -> str:
+    """Read a job description file, decoding at most MAX_JD_CHARS characters"""
+    with open(jd_file, 'r', encoding='utf-8') as f:
+        jd_text = f.read(MAX_JD_CHARS + 1)
+    
+    if len(jd_text) > MAX_JD_CHARS:
+        logger.warning(f"⚠️ Job description longer than {MAX_JD_CHARS:,} characters, truncating")
+        return jd_text[:MAX_JD_CHARS]
+    
+    return jd_text
+
 def main():
     """Command line interface for universal application generator"""
     
@@ -358,22 +916,39 @@ def main():
     parser.add_argument('--country', default='netherlands', help='Target country for currency (e.g., "sweden", "uk", "usa")')
     parser.add_argument('--jd-file', help='Path to job description text file')
     parser.add_argument('--requirements', nargs='*', help='Key requirements for the role')
+    parser.add_argument('--single-call', action='store_true',
+                        help='Generate resume, cover letter and email in one LLM call (faster, may reduce per-document quality)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the LLM response cache and any existing package for the same inputs, always calling the API')
+    parser.add_argument('--force', action='store_true',
+                        help='Regenerate even if a complete package for the same inputs already exists')
+    parser.add_argument('--zip', action='store_true',
+                        help='Save the package as a single .zip archive instead of a directory')
     
     args = parser.parse_args()
+    configure_logging()
     
     # Load JD text
     jd_text = ""
     if args.jd_file and os.path.exists(args.jd_file):
-        with open(args.jd_file, 'r', encoding='utf-8') as f:
-            jd_text = f.read()
+        jd_text = read_jd_file(args.jd_file)
     
-    print(f"🎯 UNIVERSAL APPLICATION GENERATOR")
-    print(f"=" * 60)
-    print(f"🏢 Company: {args.company}")
-    print(f"💼 Role: {args.role}")
-    print(f"📍 Location: {args.location}")
-    print(f"💰 Currency: {args.country}")
-    print(f"=" * 60)
+    logger.info("\n".join([
+        "🎯 UNIVERSAL APPLICATION GENERATOR",
+        "=" * 60,
+        f"🏢 Company: {args.company}",
+        f"💼 Role: {args.role}",
+        f"📍 Location: {args.location}",
+        f"💰 Currency: {args.country}",
+        "=" * 60
+    ]))
+    
+    signature = package_signature(args.company, args.role, args.location, args.country, jd_text, args.requirements)
+    existing_package = None if args.force or args.no_cache else find_existing_package(signature, args.company)
+    if existing_package:
+        logger.info(f"\n♻️ Package for these inputs already exists: {existing_package}")
+        logger.info(f"   Use --force to regenerate")
+        return
     
     # Create JD analysis
     jd_analysis = create_universal_jd_analysis(
@@ -381,46 +956,172 @@ def main():
     )
     
     # Generate complete package
-    print(f"\n📄 Generating Resume...")
-    resume_results = generate_universal_resume(jd_analysis, args.country)
-    
-    print(f"\n📝 Generating Cover Letter...")
-    cover_letter = generate_universal_cover_letter(jd_analysis, args.country)
-    
-    print(f"\n📧 Generating Email...")
-    email = generate_universal_email(jd_analysis)
+    resume_results, cover_letter, email, linkedin_messages = asyncio.run(generate_package_documents(
+        jd_analysis, args.country, not args.no_cache, args.single_call
+    ))
     
-    print(f"\n💼 Generating LinkedIn Messages...")
-    linkedin_messages = generate_universal_linkedin_messages(jd_analysis, args.country)
-    
-    print(f"\n💾 Saving Package...")
     package_path = save_universal_package(
-        args.company, args.role, resume_results, cover_letter, email, linkedin_messages, jd_analysis
+        args.company, args.role, resume_results, cover_letter, email, linkedin_messages, jd_analysis, args.zip
     )
+    record_package(signature, package_path)
     
-    print(f"\n🎉 APPLICATION PACKAGE COMPLETE!")
-    print(f"📁 Saved to: {package_path}")
-    print(f"\n🎯 Key Features:")
-    print(f"  ✅ Adlina-style writing (no generic language)")
-    print(f"  ✅ Target country currency ({args.country})")
-    print(f"  ✅ F&B platform experience highlighted")
-    print(f"  ✅ Specific metrics and achievements")
-    print(f"  ✅ Company-tailored content")
+    logger.info("\n".join([
+        "\n🎉 APPLICATION PACKAGE COMPLETE!",
+        f"📁 Saved to: {package_path}",
+        "\n🎯 Key Features:",
+        "  ✅ Adlina-style writing (no generic language)",
+        f"  ✅ Target country currency ({args.country})",
+        "  ✅ F&B platform experience highlighted",
+        "  ✅ Specific metrics and achievements",
+        "  ✅ Company-tailored content"
+    ]))
 
 # Example usage when imported
 def generate_application_for_company(company: str, role: str, location: str, 
                                    country: str = "netherlands", jd_text: str = "", 
-                                   requirements: list = None) -> str:
-    """Programmatic interface for generating applications"""
+                                   requirements: list = None, single_call: bool = False,
+                                   use_cache: bool = True, force: bool = False, as_zip: bool = False) -> str:
+    """Programmatic interface for generating applications
+    
+    Returns the existing package path without regenerating when a complete
+    package for identical inputs was saved before, unless force=True or
+    use_cache=False. With as_zip=True the package is saved as a single .zip archive.
+    """
+    
+    return asyncio.run(generate_application_for_company_async(
+        company, role, location, country, jd_text, requirements, single_call, use_cache, force, as_zip
+    ))
+
+async def generate_application_for_company_async(company: str, role: str, location: str,
+                                                 country: str = "netherlands", jd_text: str = "",
+                                                 requirements: list = None, single_call: bool = False,
+                                                 use_cache: bool = True, force: bool = False,
+                                                 as_zip: bool = False) -> str:
+    """Async variant of generate_application_for_company for use inside an event loop"""
+    
+    signature = package_signature(company, role, location, country, jd_text, requirements)
+    if use_cache and not force:
+        existing_package = find_existing_package(signature, company)
+        if existing_package:
+            logger.info(f"♻️ Reusing existing {company} package: {existing_package}")
+            return existing_package
     
     jd_analysis = create_universal_jd_analysis(company, role, location, jd_text, requirements)
     
-    resume_results = generate_universal_resume(jd_analysis, country)
-    cover_letter = generate_universal_cover_letter(jd_analysis, country) 
-    email = generate_universal_email(jd_analysis)
-    linkedin_messages = generate_universal_linkedin_messages(jd_analysis, country)
+    resume_results, cover_letter, email, linkedin_messages = await generate_package_documents(
+        jd_analysis, country, use_cache, single_call
+    )
+    
+    package_path = await save_universal_package_async(
+        company, role, resume_results, cover_letter, email, linkedin_messages, jd_analysis, as_zip
+    )
+    record_package(signature, package_path)
+    
+    return package_path
+
+def prefetch_bulk_documents(specs: List[Dict[str, Any]]) -> None:
+    """Submit the cover letter and email prompts of every pending spec as one batch
+    
+    Successful responses land in the LLM response cache, so the per-company
+    generations that follow read them instead of making their own round-trips.
+    Specs that bypass the cache, use single-call mode or already have a
+    package are skipped. Failed prompts are simply retried by the per-company call.
+    """
+    
+    prompts, task_types, max_tokens = [], [], []
+    
+    for spec in specs:
+        if not spec.get('use_cache', True) or spec.get('single_call', False):
+            continue
+        
+        country = spec.get('country', "netherlands")
+        jd_text = spec.get('jd_text', "")
+        requirements = spec.get('requirements')
+        if not spec.get('force', False):
+            signature = package_signature(spec['company'], spec['role'], spec['location'],
+                                          country, jd_text, requirements)
+            if find_existing_package(signature, spec['company']):
+                continue
+        
+        jd_analysis = create_universal_jd_analysis(spec['company'], spec['role'], spec['location'],
+                                                   jd_text, requirements)
+        company_slug = jd_analysis['extracted_info']['company_slug']
+        
+        prompts.append(build_cover_letter_prompt(jd_analysis, country))
+        task_types.append(f"{company_slug}_cover_letter")
+        max_tokens.append(COVER_LETTER_MAX_TOKENS)
+        
+        prompts.append(build_email_prompt(jd_analysis))
+        task_types.append(f"{company_slug}_email")
+        max_tokens.append(EMAIL_MAX_TOKENS)
+    
+    if prompts:
+        get_llm_service().batch_call_llm(prompts, task_types, use_cache=True,
+                                         max_tokens=max_tokens, temperature=0.3)
+
+async def generate_applications_bulk(specs: List[Dict[str, Any]], max_concurrency: int = 10,
+                                     rate_limit_per_minute: int = 60, verbose: bool = False) -> List[Any]:
+    """Generate packages for many companies concurrently
+    
+    Each spec holds generate_application_for_company keyword arguments.
+    Cover letter and email prompts for all specs are first sent together
+    through LLMService.batch_call_llm. At most max_concurrency applications
+    then run at once and new ones start at no more than rate_limit_per_minute. Results follow the order of specs;
+    a failed application yields its exception instead of a path. Progress
+    messages are suppressed unless verbose=True; warnings and errors still show.
+    """
+    
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    start_lock = asyncio.Lock()
+    start_interval = 60.0 / rate_limit_per_minute
+    next_start = loop.time()
+    
+    async def wait_for_start_slot():
+        nonlocal next_start
+        async with start_lock:
+            delay = next_start - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            next_start = max(next_start, loop.time()) + start_interval
+    
+    async def generate_one(spec: Dict[str, Any]) -> str:
+        async with semaphore:
+            await wait_for_start_slot()
+            return await generate_application_for_company_async(**spec)
+    
+    # Load the shared service, LinkedIn generator and profile once before applications fan out
+    get_llm_service()
+    get_user_data()
+    get_linkedin_generator()
+    
+    # Only this run's tasks and threads see the flag, so other callers of the logger keep their output
+    quiet = _quiet_progress.set(not verbose)
+    try:
+        await asyncio.to_thread(prefetch_bulk_documents, specs)
+        return await asyncio.gather(*(generate_one(spec) for spec in specs), return_exceptions=True)
+    finally:
+        _quiet_progress.reset(quiet)
+
+def _generate_application_worker(spec: Dict[str, Any]) -> str:
+    """Process pool entry point for one application spec"""
+    return generate_application_for_company(**spec)
+
+def generate_applications_parallel(specs: List[Dict[str, Any]], max_workers: int = None) -> List[str]:
+    """Generate packages for many companies across worker processes
+    
+    Each spec holds generate_application_for_company keyword arguments and
+    each application runs in its own process, so CPU-bound work (prompt
+    building, validation, local models) scales with cores. For purely
+    API-bound runs generate_applications_bulk is lighter. Workers are
+    spawned rather than forked and configure their own logging thread, so
+    each gets its own listener and LLM clients. Results follow the order of specs.
+    """
     
-    return save_universal_package(company, role, resume_results, cover_letter, email, linkedin_messages, jd_analysis)
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=configure_logging) as executor:
+        return list(executor.map(_generate_application_worker, specs))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
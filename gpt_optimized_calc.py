@@ -3,6 +3,60 @@
 GPT-4o-mini Budget Calculator - Even Better Costs!
 """
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernel runs as plain Python without numba"""
+        return lambda func: func
+
+@njit(cache=True)
+def _compute_costs(tokens_in, tokens_out, prices_in, prices_out, budget, costs, max_apps):
+    """Fill per-application cost and affordable application count for each model
+    
+    Prices are per 1M tokens. Written as a flat loop over parallel arrays so
+    numba can compile it for large model/budget sweeps.
+    """
+    for i in range(len(prices_in)):
+        cost = (tokens_in / 1_000_000) * prices_in[i] + (tokens_out / 1_000_000) * prices_out[i]
+        costs[i] = cost
+        max_apps[i] = int(budget / cost)
+
+def compute_costs(tokens_in, tokens_out, prices_in, prices_out, budget):
+    """Per-application costs and max applications within budget, one entry per model"""
+    n = len(prices_in)
+    if NUMBA_AVAILABLE:
+        costs, max_apps = np.zeros(n), np.zeros(n, dtype=np.int64)
+        _compute_costs(float(tokens_in), float(tokens_out), np.asarray(prices_in, dtype=np.float64),
+                       np.asarray(prices_out, dtype=np.float64), float(budget), costs, max_apps)
+        return costs.tolist(), max_apps.tolist()
+    
+    costs, max_apps = [0.0] * n, [0] * n
+    _compute_costs(tokens_in, tokens_out, prices_in, prices_out, budget, costs, max_apps)
+    return costs, max_apps
+
+def scenario_grid(per_app_costs, app_counts, budget):
+    """Total cost and remaining budget for every model × application-count pair
+    
+    Rows follow per_app_costs, columns follow app_counts. Uses a single NumPy
+    outer product when NumPy is installed.
+    """
+    if NUMPY_AVAILABLE:
+        costs = np.outer(np.asarray(per_app_costs, dtype=np.float64), np.asarray(app_counts, dtype=np.float64))
+        return costs.tolist(), (budget - costs).tolist()
+    
+    costs = [[apps * cost for apps in app_counts] for cost in per_app_costs]
+    return costs, [[budget - cost for cost in row] for row in costs]
+
 def calculate_gpt_optimized():
     print("🚀 EVEN BETTER NEWS: GPT-4o-mini is CHEAPER!")
     print("=" * 50)
@@ -22,22 +76,24 @@ def calculate_gpt_optimized():
     
     budget = 5.00
     
-    for model_name, pricing in models.items():
-        input_cost = (tokens_per_app['input'] / 1_000_000) * pricing['input']
-        output_cost = (tokens_per_app['output'] / 1_000_000) * pricing['output'] 
-        total_cost = input_cost + output_cost
-        
-        max_apps = int(budget / total_cost)
-        
+    model_costs, model_max_apps = compute_costs(
+        tokens_per_app['input'], tokens_per_app['output'],
+        [pricing['input'] for pricing in models.values()],
+        [pricing['output'] for pricing in models.values()],
+        budget
+    )
+    
+    app_counts = [500, 1000, 1500]
+    scenario_costs, scenario_remaining = scenario_grid(model_costs, app_counts, budget)
+    
+    for model_name, total_cost, max_apps, cost_row, remaining_row in zip(
+            models, model_costs, model_max_apps, scenario_costs, scenario_remaining):
         print(f"\n📊 {model_name.upper()}:")
         print(f"   💰 Cost per application: ${total_cost:.4f}")
         print(f"   🎯 Max applications with $5: {max_apps:,}")
         
         # Show scenarios for this model
-        for apps in [500, 1000, 1500]:
-            scenario_cost = apps * total_cost
-            remaining = budget - scenario_cost
-            
+        for apps, scenario_cost, remaining in zip(app_counts, cost_row, remaining_row):
             if remaining >= 0:
                 print(f"   ✅ {apps:,} apps: ${scenario_cost:.2f} (${remaining:.2f} left)")
             else:
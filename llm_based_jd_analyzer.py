@@ -4,42 +4,457 @@ LLM-Based Job Description Analyzer
 Dynamic analysis and resume tailoring based on LLM understanding
 """
 
+import asyncio
+import copy
+import hashlib
+import io
 import json
-import openai
-from typing import Dict, List, Optional
+import math
+import os
+import random
+import re
+import weakref
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
+try:
+    from openai import AsyncOpenAI, APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+    OPENAI_AVAILABLE = True
+    # Transient failures worth another attempt: rate limits, timeouts, dropped connections, 5xx
+    RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+except ImportError:
+    OPENAI_AVAILABLE = False
+    RETRYABLE_ERRORS = ()
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+CONTENT_SYSTEM_PROMPT = "You are an expert resume writer specializing in Product Manager roles across various tech domains."
+COMBINED_SYSTEM_PROMPT = "You are an expert Product Manager resume strategist and resume writer with deep understanding of various tech domains."
+
+ANALYZER_MODEL = "gpt-4o-mini"
+ANALYZER_TEMPERATURE = 0.3
+ANALYZER_CACHE_DIR = Path(__file__).parent / "cache" / "llm_analyzer"
+USER_PROFILE_PATH = Path(__file__).parent / "data" / "user_profile.json"
+
+# Completion attempts, with randomized exponential backoff between them capped at the max delay
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 20.0
+COMBINED_MAX_TOKENS = 2000
+
+def string_list(description: str, items: Optional[int] = None) -> Dict:
+    """JSON schema for a list of strings, optionally of fixed length"""
+    schema = {"type": "array", "items": {"type": "string"}, "description": description}
+    if items:
+        schema.update(minItems=items, maxItems=items)
+    return schema
+
+ANALYSIS_SCHEMA_PROPERTIES = {
+    "role_domain": {"type": "string", "description": "specific domain name"},
+    "role_focus": {"type": "string", "description": "detailed description of role focus"},
+    "critical_requirements": string_list("the 5 most critical requirements", items=5),
+    "experience_to_highlight": string_list("which experiences to emphasize"),
+    "primary_narrative": {"type": "string", "description": "the main story/positioning for this role"},
+    "technical_skills_focus": string_list("key technical skills to emphasize"),
+    "business_skills_focus": string_list("key business skills to emphasize"),
+    "metrics_to_highlight": string_list("types of achievements to emphasize"),
+    "messaging_tone": {"type": "string", "description": "recommended tone and approach"},
+    "resume_strategy": {"type": "string", "description": "comprehensive strategy for this specific role"}
+}
+
+CONTENT_SCHEMA_PROPERTIES = {
+    "professional_summary": {"type": "string", "description": "tailored summary text"},
+    "experience_bullets": string_list("5-6 tailored experience bullets"),
+    "technical_skills": string_list("technical skills for the skills section"),
+    "business_skills": string_list("business skills for the skills section"),
+    "positioning": {"type": "string", "description": "overall positioning strategy"}
+}
+
+def structured_output(name: str, properties: Dict) -> Dict:
+    """Strict json_schema response format requiring every listed property
+    
+    Structured output guarantees the response parses and carries every field.
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": properties,
+                "required": list(properties),
+                "additionalProperties": False
+            }
+        }
+    }
+
+COMBINED_RESPONSE_FORMAT = structured_output("jd_analysis_and_content",
+                                             {**ANALYSIS_SCHEMA_PROPERTIES, **CONTENT_SCHEMA_PROPERTIES})
+
+# Reworded JDs for the same role land within this cosine similarity of each other
+EMBEDDING_MODEL = "text-embedding-3-small"
+SEMANTIC_MATCH_THRESHOLD = 0.93
+SEMANTIC_INDEX_LIMIT = 300
+
+# Content kept from combined calls for generate_dynamic_resume_content, least recently used dropped first
+FUSED_CONTENT_LIMIT = 128
+
+# Top-level fields of the resume content response, in the order the schema lists them
+CONTENT_FIELDS = tuple(CONTENT_SCHEMA_PROPERTIES)
+
+def json_loads(data):
+    """Parse JSON from str or bytes, with orjson when available
+    
+    orjson.JSONDecodeError subclasses ValueError, so callers catch the same errors either way.
+    """
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def json_dumps(obj, indent: bool = False, sort_keys: bool = False) -> str:
+    """Serialize to a JSON string, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys)
+
+def stable_json_dumps(obj, indent: bool = False, sort_keys: bool = False) -> str:
+    """Serialize to a JSON string with the standard library only
+    
+    For text that feeds a cache key or a prompt: orjson writes non-ASCII
+    characters as-is where json escapes them, so json_dumps output depends
+    on whether orjson is installed.
+    """
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys)
+
+# Pooled clients per event loop and API key; a loop's entry goes away with the loop
+_shared_clients = weakref.WeakKeyDictionary()
+# Analyzer calls in progress per event loop; the last one to finish closes that loop's clients
+_shared_client_users = weakref.WeakKeyDictionary()
+
+def create_client(api_key: Optional[str] = None):
+    """Async OpenAI client with a keep-alive connection pool, or None when the SDK or an API key is missing
+    
+    The SDK's own retries are off because create_completion applies the retry policy.
+    """
+    if not OPENAI_AVAILABLE:
+        return None
+    try:
+        if HTTPX_AVAILABLE:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60.0),
+                timeout=httpx.Timeout(600.0, connect=5.0)
+            )
+            return AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=0)
+        return AsyncOpenAI(api_key=api_key, max_retries=0)
+    except Exception as e:
+        print(f"OpenAI client unavailable: {e}")
+        return None
+
+def get_shared_client(api_key: Optional[str] = None):
+    """Client shared by every analyzer on the running event loop
+    
+    Requests made while any analyzer call is running on the loop reuse
+    kept-alive connections instead of repeating the TCP and TLS handshake.
+    Connections belong to the loop that opened them, so each loop, for
+    example each asyncio.run, gets its own client. Must be called from a
+    coroutine.
+    """
+    clients = _shared_clients.setdefault(asyncio.get_running_loop(), {})
+    if api_key not in clients:
+        clients[api_key] = create_client(api_key)
+    return clients[api_key]
+
+async def close_shared_clients() -> None:
+    """Close the running loop's shared clients; await it before the loop ends"""
+    clients = _shared_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        if client:
+            await client.close()
+
+def closes_shared_clients(method):
+    """Close the loop's shared clients once no decorated call is running on it
+    
+    Concurrent and nested calls keep the clients open for each other, so
+    only the outermost call of the last one to finish closes them.
+    """
+    @wraps(method)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        _shared_client_users[loop] = _shared_client_users.get(loop, 0) + 1
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            _shared_client_users[loop] -= 1
+            if not _shared_client_users[loop]:
+                del _shared_client_users[loop]
+                await close_shared_clients()
+    return wrapper
+
+@lru_cache(maxsize=1)
+def read_user_profile() -> Dict:
+    """User profile JSON, read once per process and shared by every analyzer"""
+    try:
+        data = USER_PROFILE_PATH.read_bytes()
+    except FileNotFoundError:
+        return {"name": "User", "experience": []}
+    return json_loads(data)
+
+class StreamingFieldParser:
+    """Pull top-level fields out of a JSON object while it is still streaming in
+    
+    Each chunk is appended to the buffer; a field is reported once its value
+    decodes completely, so early fields are usable before the response ends.
+    """
+    
+    def __init__(self, fields: Tuple[str, ...]):
+        self.buffer = io.StringIO()
+        self.decoder = json.JSONDecoder()
+        self.pending = {field: re.compile(rf'"{field}"\s*:\s*') for field in fields}
+        self.values = {}
+    
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Add a chunk and return the (field, value) pairs it completed"""
+        self.buffer.write(chunk)
+        text = self.buffer.getvalue()
+        completed = []
+        for field, pattern in list(self.pending.items()):
+            match = pattern.search(text)
+            if not match:
+                continue
+            try:
+                value, _ = self.decoder.raw_decode(text, match.end())
+            except json.JSONDecodeError:
+                continue
+            completed.append((field, value))
+            self.values[field] = value
+            del self.pending[field]
+        return completed
+    
+    def getvalue(self) -> str:
+        return self.buffer.getvalue()
+
+# Batch jobs that end in any of these states will not produce more output
+BATCH_FINAL_STATES = ("completed", "failed", "expired", "cancelled")
+
 class LLMJobDescriptionAnalyzer:
-    def __init__(self, api_key: Optional[str] = None):
-        if api_key:
-            openai.api_key = api_key
+    def __init__(self, api_key: Optional[str] = None, client=None, semantic_cache: bool = True):
+        self.api_key = api_key
+        self._client = client
+        self.cache_dir = ANALYZER_CACHE_DIR
+        self.cache = {}
+        self.semantic_cache = semantic_cache
+        self.semantic_index = None
+        self.fused_content = OrderedDict()
         self.load_user_profile()
     
-    def load_user_profile(self):
-        """Load user profile for context"""
+    @property
+    def client(self):
+        """The client passed in, or else the running loop's shared client"""
+        return self._client or get_shared_client(self.api_key)
+    
+    async def create_completion(self, **kwargs):
+        """chat.completions.create, retrying transient errors with exponential backoff and jitter
+        
+        Anything else, or the last transient error once attempts run out,
+        is raised so the caller can fall back.
+        """
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                return await self.client.chat.completions.create(**kwargs)
+            except RETRYABLE_ERRORS as e:
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise
+                delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+                print(f"OpenAI call failed ({type(e).__name__}), retry {attempt + 1}/{MAX_ATTEMPTS - 1} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+    
+    async def _complete(self, system_prompt: str, user_prompt: str, max_tokens: int,
+                        response_format: Optional[Dict] = None) -> str:
+        """Run one chat completion and return the stripped response text"""
+        if not self.client:
+            raise RuntimeError("OpenAI client not initialized")
+        
+        extra = {"response_format": response_format} if response_format else {}
+        response = await self.create_completion(
+            model=ANALYZER_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=ANALYZER_TEMPERATURE,
+            max_tokens=max_tokens,
+            **extra
+        )
+        
+        return response.choices[0].message.content.strip()
+    
+    async def _stream_complete(self, system_prompt: str, user_prompt: str, max_tokens: int,
+                               parser: StreamingFieldParser,
+                               on_field: Callable[[str, Any], None],
+                               response_format: Optional[Dict] = None) -> str:
+        """Stream one chat completion, reporting fields through on_field as they complete"""
+        if not self.client:
+            raise RuntimeError("OpenAI client not initialized")
+        
+        extra = {"response_format": response_format} if response_format else {}
+        stream = await self.create_completion(
+            model=ANALYZER_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=ANALYZER_TEMPERATURE,
+            max_tokens=max_tokens,
+            stream=True,
+            **extra
+        )
+        
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                for field, value in parser.feed(chunk.choices[0].delta.content):
+                    on_field(field, value)
+        
+        return parser.getvalue().strip()
+    
+    async def _generate_json(self, system_prompt: str, user_prompt: str, max_tokens: int,
+                             parser: StreamingFieldParser, response_format: Optional[Dict] = None,
+                             on_field: Optional[Callable[[str, Any], None]] = None) -> Dict:
+        """Run a completion answered in JSON, streaming through parser when on_field is given"""
+        if on_field:
+            text = await self._stream_complete(system_prompt, user_prompt, max_tokens,
+                                               parser, on_field, response_format)
+        else:
+            text = await self._complete(system_prompt, user_prompt, max_tokens, response_format)
+        return json_loads(text)
+    
+    def get_cache_key(self, prompt: str) -> str:
+        """Cache key for a prompt under the current model settings"""
+        content = f"{prompt}{ANALYZER_MODEL}{ANALYZER_TEMPERATURE}"
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+    
+    def load_cached_result(self, cache_key: str) -> Optional[Dict]:
+        """Copy of a cached result from memory, then from disk
+        
+        Callers get their own copy, so editing a result never changes what
+        later calls see.
+        """
+        if cache_key in self.cache:
+            return copy.deepcopy(self.cache[cache_key])
+        
+        cache_file = self.cache_dir / f"{cache_key}.json"
+        if cache_file.exists():
+            try:
+                self.cache[cache_key] = json_loads(cache_file.read_bytes())
+                return copy.deepcopy(self.cache[cache_key])
+            except Exception as e:
+                print(f"Warning: Failed to load cached result: {e}")
+        
+        return None
+    
+    def save_result_to_cache(self, cache_key: str, result: Dict):
+        """Keep a copy of result in memory and write it to disk atomically"""
+        self.cache[cache_key] = copy.deepcopy(result)
         try:
-            profile_path = Path(__file__).parent / "data" / "user_profile.json"
-            with open(profile_path, 'r', encoding='utf-8') as f:
-                self.user_profile = json.load(f)
-        except FileNotFoundError:
-            self.user_profile = {"name": "User", "experience": []}
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = self.cache_dir / f"{cache_key}.json"
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_text(json_dumps(result, indent=True), encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            print(f"Warning: Failed to cache result: {e}")
+    
+    def load_semantic_index(self) -> List[Dict]:
+        """Stored (embedding, cache_key) entries for previously analyzed JDs"""
+        if self.semantic_index is None:
+            self.semantic_index = []
+            index_file = self.cache_dir / "semantic_index.json"
+            if index_file.exists():
+                try:
+                    self.semantic_index = json_loads(index_file.read_bytes())
+                except Exception as e:
+                    print(f"Warning: Failed to load semantic index: {e}")
+        return self.semantic_index
     
-    def analyze_job_description(self, jd_text: str) -> Dict:
+    def save_semantic_index(self):
+        """Write the semantic index to disk atomically"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            index_file = self.cache_dir / "semantic_index.json"
+            tmp_file = index_file.with_name(f"{index_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_text(json_dumps(self.semantic_index), encoding='utf-8')
+            os.replace(tmp_file, index_file)
+        except Exception as e:
+            print(f"Warning: Failed to save semantic index: {e}")
+    
+    async def embed(self, text: str) -> Optional[List[float]]:
+        """Unit-length embedding of text, or None when embeddings are unavailable"""
+        if not self.client:
+            return None
+        try:
+            response = await self.client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+            vector = response.data[0].embedding
+        except Exception as e:
+            print(f"Embedding failed: {e}")
+            return None
+        
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+    
+    def find_similar_analysis(self, embedding: List[float]) -> Optional[Dict]:
+        """Cached analysis of the most similar stored JD, if it clears the match threshold
+        
+        The index holds at most a few hundred unit vectors, so a flat scan of
+        dot products is enough and needs no vector index.
         """
-        Use LLM to analyze job description and determine resume strategy
+        best_score, best_key = 0.0, None
+        for entry in self.load_semantic_index():
+            score = sum(a * b for a, b in zip(embedding, entry["embedding"]))
+            if score > best_score:
+                best_score, best_key = score, entry["cache_key"]
+        
+        if best_key is None or best_score < SEMANTIC_MATCH_THRESHOLD:
+            return None
         
-        Returns comprehensive analysis for dynamic resume generation
+        return self.load_cached_result(best_key)
+    
+    def add_to_semantic_index(self, embedding: List[float], cache_key: str):
+        """Remember an analyzed JD, dropping the oldest entries beyond the index limit"""
+        index = self.load_semantic_index()
+        index.append({"embedding": embedding, "cache_key": cache_key})
+        del index[:-SEMANTIC_INDEX_LIMIT]
+        self.save_semantic_index()
+    
+    def load_user_profile(self):
+        """Load user profile for context"""
+        self.user_profile = read_user_profile()
+    
+    def build_combined_prompt(self, jd_text: str) -> str:
+        """Prompt asking for the analysis and the tailored resume content in one response
+        
+        The instructions are static and come first, with the JD last, so repeated
+        calls share a long prompt prefix the API can serve from its prompt cache.
         """
         
-        analysis_prompt = f"""
-You are an expert Product Manager resume strategist. Analyze this job description and provide a comprehensive analysis for resume tailoring.
-
-JOB DESCRIPTION:
-{jd_text}
+        return f"""
+You are an expert Product Manager resume strategist. Analyze the job description at the end of this message for resume tailoring, then write the tailored resume content that follows from your analysis.
 
-USER BACKGROUND CONTEXT:
+USER PROFILE CONTEXT:
+- Name: {self.user_profile.get('name', 'Vinesh Kumar')}
 - 7+ years Product Management experience
 - Experience with: Enterprise automation, Salesforce/SAP integration, AI/ML systems, mobile platforms (600K+ users), contract automation, RAG systems, API integrations, B2B/B2C products
+- Key achievements: $2M revenue acceleration, 600K+ users, 94% accuracy AI systems, contract automation
 
 ANALYSIS REQUIRED:
 
@@ -65,53 +480,212 @@ What type of metrics/achievements should be highlighted?
 7. TONE & MESSAGING:
 What messaging approach would resonate best?
 
-Please respond in this exact JSON format:
-{{
-    "role_domain": "specific domain name",
-    "role_focus": "detailed description of role focus",
-    "critical_requirements": ["req1", "req2", "req3", "req4", "req5"],
-    "experience_to_highlight": ["which experiences to emphasize"],
-    "primary_narrative": "the main story/positioning for this role",
-    "technical_skills_focus": ["key technical skills to emphasize"],
-    "business_skills_focus": ["key business skills to emphasize"],
-    "metrics_to_highlight": ["types of achievements to emphasize"],
-    "messaging_tone": "recommended tone and approach",
-    "resume_strategy": "comprehensive strategy for this specific role"
-}}
+THEN GENERATE, following your analysis:
+
+1. PROFESSIONAL SUMMARY (50-80 words)
+- Emphasize experience in the role domain
+- Highlight the primary narrative
+- Include relevant metrics/achievements
+
+2. KEY EXPERIENCE BULLETS (5-6 bullets)
+- Reframe existing experience to match the role focus
+- Emphasize the experiences to highlight
+- Highlight the metrics to highlight
+
+3. SKILLS SECTION
+Technical and business skills drawn from the skills emphasis.
+
+Respond with JSON matching the jd_analysis_and_content schema.
+
+JOB DESCRIPTION:
+{jd_text}
 """
+    
+    @closes_shared_clients
+    async def analyze_combined(self, jd_text: str, force_refresh: bool = False,
+                               on_field: Optional[Callable[[str, Any], None]] = None) -> Dict:
+        """
+        Analyze a job description and generate resume content in one LLM call
+        
+        Returns the analysis fields and the content fields in one dict.
+        Results are cached per prompt, and a reworded JD close enough to one
+        already analyzed reuses that result; force_refresh bypasses both.
+        The JD is only embedded for that semantic lookup, so forced refreshes
+        and analyzers built with semantic_cache=False make no embeddings call.
+        With on_field the content fields are reported as they stream in.
+        """
+        
+        combined_prompt = self.build_combined_prompt(jd_text)
+        cache_key = self.get_cache_key(combined_prompt)
+        
+        if not force_refresh:
+            cached = self.load_cached_result(cache_key)
+            if cached is not None:
+                return self.report_fields(cached, on_field)
+        
+        embedding = None
+        if self.semantic_cache and not force_refresh:
+            embedding = await self.embed(jd_text)
+        if embedding is not None:
+            similar = self.find_similar_analysis(embedding)
+            if similar is not None:
+                self.save_result_to_cache(cache_key, similar)
+                return self.report_fields(similar, on_field)
 
+        parser = StreamingFieldParser(CONTENT_FIELDS)
         try:
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert Product Manager resume strategist with deep understanding of various tech domains."},
-                    {"role": "user", "content": analysis_prompt}
+            combined = await self._generate_json(COMBINED_SYSTEM_PROMPT, combined_prompt, COMBINED_MAX_TOKENS,
+                                                 parser, COMBINED_RESPONSE_FORMAT, on_field)
+            self.save_result_to_cache(cache_key, combined)
+            if embedding is not None:
+                self.add_to_semantic_index(embedding, cache_key)
+            
+            return combined
+            
+        except Exception as e:
+            print(f"LLM Analysis failed: {e}")
+            # Fallback to basic analysis, keeping any content the stream already delivered
+            combined = {**self._fallback_analysis(jd_text), **self._fallback_content(), **parser.values}
+            return self.report_fields(combined, on_field, [field for field in CONTENT_FIELDS if field in parser.pending])
+    
+    def split_combined(self, combined: Dict) -> Tuple[Dict, Dict]:
+        """Split a combined result into (analysis, content)
+        
+        A copy of the content is remembered against the analysis so a later
+        generate_dynamic_resume_content call for it needs no second request.
+        Only the FUSED_CONTENT_LIMIT most recently used entries are kept.
+        """
+        analysis = {field: combined[field] for field in ANALYSIS_SCHEMA_PROPERTIES if field in combined}
+        content = {field: combined[field] for field in CONTENT_FIELDS if field in combined}
+        key = self.analysis_key(analysis)
+        self.fused_content[key] = copy.deepcopy(content)
+        self.fused_content.move_to_end(key)
+        while len(self.fused_content) > FUSED_CONTENT_LIMIT:
+            self.fused_content.popitem(last=False)
+        return analysis, content
+    
+    def analysis_key(self, jd_analysis: Dict) -> str:
+        """Stable key for an analysis dict"""
+        return self.get_cache_key(stable_json_dumps(jd_analysis, sort_keys=True))
+    
+    @closes_shared_clients
+    async def analyze_job_description(self, jd_text: str, force_refresh: bool = False) -> Dict:
+        """
+        Use LLM to analyze job description and determine resume strategy
+        
+        Returns comprehensive analysis for dynamic resume generation. The
+        content is generated in the same call and kept for
+        generate_dynamic_resume_content.
+        """
+        analysis, _ = self.split_combined(await self.analyze_combined(jd_text, force_refresh))
+        return analysis
+    
+    @closes_shared_clients
+    async def analyze_job_descriptions_batch(self, jd_texts: List[str], poll_interval: float = 30.0) -> List[Dict]:
+        """
+        Analyze many job descriptions through the OpenAI Batch API
+        
+        Meant for queued, non-interactive runs: requests are uploaded as one
+        JSONL file and complete within the 24h batch window at reduced cost.
+        Each request is the combined analysis and content prompt, cached under
+        the same key as analyze_job_description, so either path reuses the
+        other's results and the content is kept for
+        generate_dynamic_resume_content. Only cache misses are submitted; a
+        single miss goes through the realtime path instead. Results follow the
+        order of jd_texts; any JD without a usable result gets the fallback
+        analysis.
+        """
+        
+        prompts = [self.build_combined_prompt(jd_text) for jd_text in jd_texts]
+        cache_keys = [self.get_cache_key(prompt) for prompt in prompts]
+        results = {i: self.load_cached_result(cache_key) for i, cache_key in enumerate(cache_keys)}
+        pending = [i for i, result in results.items() if result is None]
+        
+        if len(pending) <= 1 or not self.client:
+            for i in pending:
+                results[i] = await self.analyze_combined(jd_texts[i])
+            return [self.split_combined(results[i])[0] for i in range(len(jd_texts))]
+        
+        requests = "\n".join(json_dumps({
+            "custom_id": str(i),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": ANALYZER_MODEL,
+                "messages": [
+                    {"role": "system", "content": COMBINED_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompts[i]}
                 ],
-                temperature=0.3,
-                max_tokens=2000
+                "temperature": ANALYZER_TEMPERATURE,
+                "max_tokens": COMBINED_MAX_TOKENS,
+                "response_format": COMBINED_RESPONSE_FORMAT
+            }
+        }) for i in pending)
+        
+        try:
+            batch_file = await self.client.files.create(
+                file=("jd_analysis_batch.jsonl", requests.encode("utf-8")),
+                purpose="batch"
             )
+            batch = await self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            print(f"Submitted batch {batch.id} with {len(pending)} job descriptions")
             
-            analysis_text = response.choices[0].message.content.strip()
-            # Parse JSON response
-            analysis = json.loads(analysis_text)
-            
-            return analysis
+            while batch.status not in BATCH_FINAL_STATES:
+                await asyncio.sleep(poll_interval)
+                batch = await self.client.batches.retrieve(batch.id)
             
+            if batch.status == "completed" and batch.output_file_id:
+                output = await self.client.files.content(batch.output_file_id)
+                for line in output.text.splitlines():
+                    if not line.strip():
+                        continue
+                    record = json_loads(line)
+                    try:
+                        content = record["response"]["body"]["choices"][0]["message"]["content"]
+                        i = int(record["custom_id"])
+                        results[i] = json_loads(content.strip())
+                        self.save_result_to_cache(cache_keys[i], results[i])
+                    except (KeyError, IndexError, TypeError, ValueError) as e:
+                        print(f"Batch result {record.get('custom_id')} unusable: {e}")
+            else:
+                print(f"Batch {batch.id} ended with status {batch.status}")
+                
         except Exception as e:
-            print(f"LLM Analysis failed: {e}")
-            # Fallback to basic analysis
-            return self._fallback_analysis(jd_text)
+            print(f"Batch analysis failed: {e}")
+        
+        return [self.split_combined(results[i] if results[i] is not None else
+                                    {**self._fallback_analysis(jd_text), **self._fallback_content()})[0]
+                for i, jd_text in enumerate(jd_texts)]
     
-    def generate_dynamic_resume_content(self, jd_analysis: Dict, country: str = "global") -> Dict:
+    @closes_shared_clients
+    async def generate_dynamic_resume_content(self, jd_analysis: Dict, country: str = "global",
+                                              force_refresh: bool = False,
+                                              on_field: Optional[Callable[[str, Any], None]] = None) -> Dict:
         """
         Generate dynamic resume content based on LLM analysis
+        
+        Content already generated alongside this analysis by
+        analyze_job_description is returned without another request.
+        Otherwise results are cached per prompt; force_refresh bypasses the cache.
+        With on_field the response is streamed and on_field(name, value) is
+        called as each top-level field completes, e.g. so the summary can be
+        written out while the experience bullets are still generating.
         """
         
+        fused_key = self.analysis_key(jd_analysis)
+        if fused_key in self.fused_content and not force_refresh:
+            self.fused_content.move_to_end(fused_key)
+            return self.report_fields(copy.deepcopy(self.fused_content[fused_key]), on_field)
+        
         content_prompt = f"""
 Based on this job analysis, create a tailored resume summary and experience bullets for the user.
 
 JOB ANALYSIS:
-{json.dumps(jd_analysis, indent=2)}
+{stable_json_dumps(jd_analysis, indent=True)}
 
 USER PROFILE CONTEXT:
 - Name: {self.user_profile.get('name', 'Vinesh Kumar')}
@@ -144,25 +718,46 @@ Respond in JSON format:
 }}
 """
 
+        cache_key = self.get_cache_key(content_prompt)
+        if not force_refresh:
+            cached = self.load_cached_result(cache_key)
+            if cached is not None:
+                return self.report_fields(cached, on_field)
+
+        parser = StreamingFieldParser(CONTENT_FIELDS)
         try:
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert resume writer specializing in Product Manager roles across various tech domains."},
-                    {"role": "user", "content": content_prompt}
-                ],
-                temperature=0.3,
-                max_tokens=1500
-            )
-            
-            content_text = response.choices[0].message.content.strip()
-            content = json.loads(content_text)
+            content = await self._generate_json(CONTENT_SYSTEM_PROMPT, content_prompt, 1500,
+                                                parser, on_field=on_field)
+            self.save_result_to_cache(cache_key, content)
             
             return content
             
         except Exception as e:
             print(f"Content generation failed: {e}")
-            return self._fallback_content()
+            # Keep whatever the stream already delivered and fill in the rest
+            content = {**self._fallback_content(), **parser.values}
+            return self.report_fields(content, on_field, [field for field in CONTENT_FIELDS if field in parser.pending])
+    
+    def report_fields(self, content: Dict, on_field: Optional[Callable[[str, Any], None]],
+                      fields: Optional[List[str]] = None) -> Dict:
+        """Pass already-available content fields to on_field, then return content"""
+        if on_field:
+            for field in fields if fields is not None else CONTENT_FIELDS:
+                if field in content:
+                    on_field(field, content[field])
+        return content
+    
+    @closes_shared_clients
+    async def analyze_and_generate(self, jd_text: str, country: str = "global",
+                                   force_refresh: bool = False,
+                                   on_field: Optional[Callable[[str, Any], None]] = None) -> Tuple[Dict, Dict]:
+        """Analyze a job description and generate resume content in a single request"""
+        return self.split_combined(await self.analyze_combined(jd_text, force_refresh, on_field))
+    
+    @closes_shared_clients
+    async def analyze_many(self, jd_texts: List[str], country: str = "global") -> List[Tuple[Dict, Dict]]:
+        """Run analyze_and_generate for several job descriptions concurrently"""
+        return await asyncio.gather(*(self.analyze_and_generate(jd_text, country) for jd_text in jd_texts))
     
     def _fallback_analysis(self, jd_text: str) -> Dict:
         """Fallback analysis if LLM fails"""
@@ -4,12 +4,15 @@ Enhanced Job Application Generator
 Generates tailored resumes, cover letters, and outreach messages based on job descriptions.
 """
 
+import html
 import json
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import argparse
+from string import Template
 
 from modules.jd_parser import JobDescriptionParser
 from modules.resume_generator import ResumeGenerator
@@ -18,6 +21,140 @@ from modules.message_generator import MessageGenerator
 from modules.country_config import CountryConfig
 from modules.role_fit_analyzer import RoleFitAnalyzer
 
+COUNTRIES = ("netherlands", "finland", "ireland", "sweden", "denmark", "portugal")
+
+BOLD_PATTERN = re.compile(r"\*\*(.+?)\*\*", re.DOTALL)
+
+# Stylesheet for every package page; constant, so it is kept out of the template
+# and passed in as a value rather than being rescanned on each substitution
+PACKAGE_CSS = """        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; margin: 0; padding: 20px; background-color: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 0 20px rgba(0,0,0,0.1); }
+        .header { text-align: center; margin-bottom: 30px; padding-bottom: 20px; border-bottom: 2px solid #3498db; }
+        .fit-analysis { padding: 20px; border-radius: 8px; margin: 20px 0; border-left: 5px solid; }
+        .fit-good { background: #d4edda; border-left-color: #28a745; }
+        .fit-poor { background: #f8d7da; border-left-color: #dc3545; }
+        .section { margin: 30px 0; padding: 20px; border: 1px solid #e0e0e0; border-radius: 8px; background: #fafafa; }
+        .section h2 { color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px; }
+        .resume { background: white; padding: 25px; border-radius: 8px; box-shadow: 0 2px 5px rgba(0,0,0,0.1); }
+        .copy-btn { background: #3498db; color: white; border: none; padding: 8px 15px; border-radius: 4px; cursor: pointer; float: right; margin-bottom: 10px; }
+        .copy-btn:hover { background: #2980b9; }
+        .stats { display: flex; justify-content: space-around; margin: 20px 0; }
+        .stat { text-align: center; padding: 15px; background: #ecf0f1; border-radius: 8px; }
+        .gap { color: #e74c3c; margin: 5px 0; }
+        .strength { color: #27ae60; margin: 5px 0; }
+        .warning { color: #f39c12; }
+        .success { color: #27ae60; }"""
+
+# Page layout for the application package, parsed once at import and filled per package
+PACKAGE_HTML_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$company_name - Application Package</title>
+    <style>
+$styles
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>$company_name - $role_title</h1>
+            <p><strong>Generated:</strong> $generated</p>
+            <p><strong>Country:</strong> $country</p>
+        </div>
+        
+        <div class="fit-analysis $fit_class">
+            <h2>🎯 Role Fit Analysis</h2>
+            <div class="stats">
+                <div class="stat">
+                    <h3>$fit_score/100</h3>
+                    <p>Fit Score</p>
+                </div>
+                <div class="stat">
+                    <h3>$recommended</h3>
+                    <p>Recommended</p>
+                </div>
+                <div class="stat">
+                    <h3>$effort_required</h3>
+                    <p>Effort Required</p>
+                </div>
+            </div>
+            <p><strong>Recommendation:</strong> $recommendation</p>
+            
+            $critical_gaps
+            
+            $strengths
+        </div>
+
+        <div class="section">
+            <h2>📄 Resume</h2>
+            <button class="copy-btn" onclick="copyToClipboard('resume-content')">Copy Resume</button>
+            <div class="resume" id="resume-content">
+                $resume
+            </div>
+        </div>
+
+        <div class="section">
+            <h2>📝 Cover Letter</h2>
+            <button class="copy-btn" onclick="copyToClipboard('cover-content')">Copy Cover Letter</button>
+            <div id="cover-content">
+                $cover_letter
+            </div>
+        </div>
+
+        <div class="section">
+            <h2>💬 LinkedIn Message</h2>
+            <p><strong>Length:</strong> $linkedin_length characters $linkedin_status</p>
+            <button class="copy-btn" onclick="copyToClipboard('linkedin-content')">Copy Message</button>
+            <div id="linkedin-content">
+                $linkedin_msg
+            </div>
+        </div>
+
+        <div class="section">
+            <h2>📧 Email Template</h2>
+            <p><strong>Subject:</strong> $email_subject</p>
+            <button class="copy-btn" onclick="copyToClipboard('email-content')">Copy Email</button>
+            <div id="email-content">
+                $email_body
+            </div>
+        </div>
+
+        <div class="section">
+            <h2>📊 Changes Made</h2>
+            $changes
+        </div>
+
+        <div style="text-align: center; margin-top: 30px; color: #7f8c8d;">
+            <p><em>Generated by Enhanced Job Application Generator</em></p>
+        </div>
+    </div>
+
+    <script>
+        function copyToClipboard(elementId) {
+            const element = document.getElementById(elementId);
+            const text = element.innerText || element.textContent;
+            navigator.clipboard.writeText(text).then(function() {
+                const button = event.target;
+                const originalText = button.textContent;
+                button.textContent = 'Copied!';
+                button.style.background = '#27ae60';
+                setTimeout(() => {
+                    button.textContent = originalText;
+                    button.style.background = '#3498db';
+                }, 2000);
+            });
+        }
+    </script>
+</body>
+</html>""")
+
+def md_to_html(text: str) -> str:
+    """Escape generated text for HTML, keep line breaks and render **bold** spans"""
+    text = html.escape(text, quote=False).replace("\n", "<br>")
+    return BOLD_PATTERN.sub(r"<strong>\1</strong>", text)
+
 class JobApplicationGenerator:
     def __init__(self):
         self.jd_parser = JobDescriptionParser()
@@ -27,7 +164,8 @@ class JobApplicationGenerator:
         self.country_config = CountryConfig()
         self.role_fit_analyzer = RoleFitAnalyzer()
         
-    def generate_application_package(self, job_description: str, country: str, company_name: str = None) -> str:
+    def generate_application_package(self, job_description: str, country: str, company_name: str = None,
+                                     proceed_on_low_fit: Optional[bool] = None) -> str:
         """
         Main workflow: Generate complete application package
         
@@ -35,6 +173,8 @@ class JobApplicationGenerator:
             job_description: Full job description text
             country: Target country (netherlands, finland, ireland, sweden, denmark, portugal)
             company_name: Company name (extracted from JD if not provided)
+            proceed_on_low_fit: Whether to continue when the fit check advises against
+                applying (asks interactively if None)
             
         Returns:
             Path to generated markdown file
@@ -61,8 +201,9 @@ class JobApplicationGenerator:
                 for gap in fit_analysis['critical_gaps']:
                     print(f"   • {gap}")
             
-            proceed = input("\nDo you still want to generate the application? (y/N): ").lower()
-            if proceed != 'y':
+            if proceed_on_low_fit is None:
+                proceed_on_low_fit = input("\nDo you still want to generate the application? (y/N): ").lower() == 'y'
+            if not proceed_on_low_fit:
                 print("❌ Application generation cancelled.")
                 return None
         
@@ -102,124 +243,40 @@ class JobApplicationGenerator:
         # Get fit score
         fit_score = fit_analysis.get('fit_score', 0)
         
-        # Create HTML content
-        content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{company_name} - Application Package</title>
-    <style>
-        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; margin: 0; padding: 20px; background-color: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 0 20px rgba(0,0,0,0.1); }}
-        .header {{ text-align: center; margin-bottom: 30px; padding-bottom: 20px; border-bottom: 2px solid #3498db; }}
-        .fit-analysis {{ background: {('#d4edda' if fit_score >= 60 else '#f8d7da')}; padding: 20px; border-radius: 8px; margin: 20px 0; border-left: 5px solid {('#28a745' if fit_score >= 60 else '#dc3545')}; }}
-        .section {{ margin: 30px 0; padding: 20px; border: 1px solid #e0e0e0; border-radius: 8px; background: #fafafa; }}
-        .section h2 {{ color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px; }}
-        .resume {{ background: white; padding: 25px; border-radius: 8px; box-shadow: 0 2px 5px rgba(0,0,0,0.1); }}
-        .copy-btn {{ background: #3498db; color: white; border: none; padding: 8px 15px; border-radius: 4px; cursor: pointer; float: right; margin-bottom: 10px; }}
-        .copy-btn:hover {{ background: #2980b9; }}
-        .stats {{ display: flex; justify-content: space-around; margin: 20px 0; }}
-        .stat {{ text-align: center; padding: 15px; background: #ecf0f1; border-radius: 8px; }}
-        .gap {{ color: #e74c3c; margin: 5px 0; }}
-        .strength {{ color: #27ae60; margin: 5px 0; }}
-        .warning {{ color: #f39c12; }}
-        .success {{ color: #27ae60; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>{company_name} - {jd_data.get('role_title', 'Product Manager')}</h1>
-            <p><strong>Generated:</strong> {datetime.now().strftime("%B %d, %Y at %I:%M %p")}</p>
-            <p><strong>Country:</strong> {country.title()}</p>
-        </div>
+        critical_gaps = ''
+        if fit_analysis['critical_gaps']:
+            critical_gaps = ('<div><h4>❌ Critical Gaps:</h4>'
+                             + ''.join(f'<div class="gap">• {html.escape(gap)}</div>' for gap in fit_analysis['critical_gaps'])
+                             + '</div>')
         
-        <div class="fit-analysis">
-            <h2>🎯 Role Fit Analysis</h2>
-            <div class="stats">
-                <div class="stat">
-                    <h3>{fit_score:.0f}/100</h3>
-                    <p>Fit Score</p>
-                </div>
-                <div class="stat">
-                    <h3>{'✅' if fit_analysis['should_apply'] else '❌'}</h3>
-                    <p>Recommended</p>
-                </div>
-                <div class="stat">
-                    <h3>{fit_analysis['effort_required'].title()}</h3>
-                    <p>Effort Required</p>
-                </div>
-            </div>
-            <p><strong>Recommendation:</strong> {fit_analysis['recommendation']}</p>
-            
-            {('<div><h4>❌ Critical Gaps:</h4>' + ''.join(f'<div class="gap">• {gap}</div>' for gap in fit_analysis['critical_gaps']) + '</div>') if fit_analysis['critical_gaps'] else ''}
-            
-            {('<div><h4>✅ Strengths:</h4>' + ''.join(f'<div class="strength">• {strength}</div>' for strength in fit_analysis['strengths']) + '</div>') if fit_analysis['strengths'] else ''}
-        </div>
-
-        <div class="section">
-            <h2>📄 Resume</h2>
-            <button class="copy-btn" onclick="copyToClipboard('resume-content')">Copy Resume</button>
-            <div class="resume" id="resume-content">
-                {resume.replace(chr(10), '<br>').replace('**', '<strong>').replace('**', '</strong>')}
-            </div>
-        </div>
-
-        <div class="section">
-            <h2>📝 Cover Letter</h2>
-            <button class="copy-btn" onclick="copyToClipboard('cover-content')">Copy Cover Letter</button>
-            <div id="cover-content">
-                {cover_letter.replace(chr(10), '<br>').replace('**', '<strong>').replace('**', '</strong>')}
-            </div>
-        </div>
-
-        <div class="section">
-            <h2>💬 LinkedIn Message</h2>
-            <p><strong>Length:</strong> {len(linkedin_msg)} characters {'<span class="success">✅</span>' if len(linkedin_msg) <= 400 else '<span class="warning">⚠️</span>'}</p>
-            <button class="copy-btn" onclick="copyToClipboard('linkedin-content')">Copy Message</button>
-            <div id="linkedin-content">
-                {linkedin_msg.replace(chr(10), '<br>')}
-            </div>
-        </div>
-
-        <div class="section">
-            <h2>📧 Email Template</h2>
-            <p><strong>Subject:</strong> {email_msg.get('subject', 'N/A')}</p>
-            <button class="copy-btn" onclick="copyToClipboard('email-content')">Copy Email</button>
-            <div id="email-content">
-                {email_msg.get('body', '').replace(chr(10), '<br>')}
-            </div>
-        </div>
-
-        <div class="section">
-            <h2>📊 Changes Made</h2>
-            {self._format_changes_html(changes)}
-        </div>
-
-        <div style="text-align: center; margin-top: 30px; color: #7f8c8d;">
-            <p><em>Generated by Enhanced Job Application Generator</em></p>
-        </div>
-    </div>
-
-    <script>
-        function copyToClipboard(elementId) {{
-            const element = document.getElementById(elementId);
-            const text = element.innerText || element.textContent;
-            navigator.clipboard.writeText(text).then(function() {{
-                const button = event.target;
-                const originalText = button.textContent;
-                button.textContent = 'Copied!';
-                button.style.background = '#27ae60';
-                setTimeout(() => {{
-                    button.textContent = originalText;
-                    button.style.background = '#3498db';
-                }}, 2000);
-            }});
-        }}
-    </script>
-</body>
-</html>"""
+        strengths = ''
+        if fit_analysis['strengths']:
+            strengths = ('<div><h4>✅ Strengths:</h4>'
+                         + ''.join(f'<div class="strength">• {html.escape(strength)}</div>' for strength in fit_analysis['strengths'])
+                         + '</div>')
+        
+        content = PACKAGE_HTML_TEMPLATE.substitute(
+            company_name=html.escape(company_name),
+            role_title=html.escape(jd_data.get('role_title', 'Product Manager')),
+            generated=datetime.now().strftime("%B %d, %Y at %I:%M %p"),
+            country=html.escape(country.title()),
+            styles=PACKAGE_CSS,
+            fit_class='fit-good' if fit_score >= 60 else 'fit-poor',
+            fit_score=f"{fit_score:.0f}",
+            recommended='✅' if fit_analysis['should_apply'] else '❌',
+            effort_required=html.escape(fit_analysis['effort_required'].title()),
+            recommendation=html.escape(fit_analysis['recommendation']),
+            critical_gaps=critical_gaps,
+            strengths=strengths,
+            resume=md_to_html(resume),
+            cover_letter=md_to_html(cover_letter),
+            linkedin_length=len(linkedin_msg),
+            linkedin_status='<span class="success">✅</span>' if len(linkedin_msg) <= 400 else '<span class="warning">⚠️</span>',
+            linkedin_msg=md_to_html(linkedin_msg),
+            email_subject=html.escape(email_msg.get('subject', 'N/A')),
+            email_body=md_to_html(email_msg.get('body', '')),
+            changes=self._format_changes_html(changes)
+        )
         
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(content)
@@ -231,31 +288,21 @@ class JobApplicationGenerator:
         if not changes:
             return "No specific changes made to base resume."
         
-        formatted = []
-        for i, change in enumerate(changes, 1):
-            formatted.append(f"{i}. {change}")
-        
-        return "\n".join(formatted)
+        return "\n".join(f"{i}. {change}" for i, change in enumerate(changes, 1))
     
     def _format_changes_html(self, changes: List[str]) -> str:
         """Format the changes list for HTML output"""
         if not changes:
             return "<p>No specific changes made to base resume.</p>"
         
-        formatted = []
-        for i, change in enumerate(changes, 1):
-            formatted.append(f"<li>{change}</li>")
-        
-        return f"<ol>{''.join(formatted)}</ol>"
+        # <ol> numbers the items itself
+        return "<ol>" + "".join(f"<li>{html.escape(change)}</li>" for change in changes) + "</ol>"
 
-def main():
-    """Interactive command line interface"""
-    print("🚀 Enhanced Job Application Generator")
-    print("=" * 50)
-    
-    generator = JobApplicationGenerator()
+def read_job_description() -> str:
+    """Job description from piped stdin in one read, or pasted interactively"""
+    if not sys.stdin.isatty():
+        return sys.stdin.read().strip()
     
-    # Get job description
     print("\n📋 Please paste the job description below (press Enter twice when done):")
     job_description_lines = []
     empty_lines = 0
@@ -268,36 +315,82 @@ def main():
             empty_lines = 0
         job_description_lines.append(line)
     
-    job_description = "\n".join(job_description_lines).strip()
-    
-    if not job_description:
-        print("❌ Error: No job description provided.")
-        return
-    
-    # Get country
+    return "\n".join(job_description_lines).strip()
+
+def select_country() -> Optional[str]:
+    """Country picked from the numbered menu, or None if stdin runs out"""
     print("\n🌍 Select target country:")
-    countries = ["netherlands", "finland", "ireland", "sweden", "denmark", "portugal"]
-    for i, country in enumerate(countries, 1):
+    for i, country in enumerate(COUNTRIES, 1):
         print(f"  {i}. {country.title()}")
     
     while True:
         try:
-            choice = int(input("\nEnter choice (1-6): "))
-            if 1 <= choice <= 6:
-                selected_country = countries[choice - 1]
-                break
+            choice = int(input(f"\nEnter choice (1-{len(COUNTRIES)}): "))
+            if 1 <= choice <= len(COUNTRIES):
+                return COUNTRIES[choice - 1]
             else:
-                print("Please enter a number between 1 and 6.")
+                print(f"Please enter a number between 1 and {len(COUNTRIES)}.")
         except ValueError:
             print("Please enter a valid number.")
+        except EOFError:
+            # stdin closed before a choice was made
+            return None
+
+def main():
+    """Command line interface; prompts for anything not given as a flag"""
+    parser = argparse.ArgumentParser(description='Generate a tailored application package from a job description')
+    parser.add_argument('--jd-file', help='Path to job description text file (default: read from stdin or prompt)')
+    parser.add_argument('--country', choices=COUNTRIES, help='Target country (skips the country menu)')
+    parser.add_argument('--company', help='Company name (skips the prompt; extracted from the JD if omitted)')
+    parser.add_argument('--yes', action='store_true',
+                        help='Generate even when the role fit check advises against applying')
+    args = parser.parse_args()
+    
+    # A JD piped on stdin leaves nothing to answer the country menu with
+    if not args.jd_file and not args.country and not sys.stdin.isatty():
+        parser.error("--country is required when the job description is piped on stdin")
+    
+    # With the JD and country given as flags, or stdin piped, nothing is asked interactively
+    scripted = bool(args.jd_file and args.country) or not sys.stdin.isatty()
+    
+    print("🚀 Enhanced Job Application Generator")
+    print("=" * 50)
+    
+    generator = JobApplicationGenerator()
+    
+    # Get job description
+    if args.jd_file:
+        with open(args.jd_file, 'r', encoding='utf-8') as f:
+            job_description = f.read().strip()
+    else:
+        job_description = read_job_description()
+    
+    if not job_description:
+        print("❌ Error: No job description provided.")
+        return
+    
+    # Get country
+    selected_country = args.country or select_country()
+    if not selected_country:
+        print("❌ Error: No country selected.")
+        return
     
     # Optional: Get company name
-    company_name = input(f"\n🏢 Company name (optional, will extract from JD): ").strip()
+    if args.company is not None:
+        company_name = args.company.strip()
+    elif scripted:
+        company_name = ""
+    else:
+        try:
+            company_name = input(f"\n🏢 Company name (optional, will extract from JD): ").strip()
+        except EOFError:
+            company_name = ""
     
     # Generate application package
     try:
         output_path = generator.generate_application_package(
-            job_description, selected_country, company_name or None
+            job_description, selected_country, company_name or None,
+            proceed_on_low_fit=args.yes if scripted else None
         )
         
         print(f"\n🎉 Success! Application package saved to: {output_path}")
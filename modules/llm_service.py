@@ -8,10 +8,12 @@ import json
 import os
 import time
 import logging
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Callable
 from dataclasses import dataclass
 from pathlib import Path
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from .logging_config import get_logger
 
 try:
@@ -28,6 +30,19 @@ except ImportError:
     OPENAI_AVAILABLE = False
     print("Warning: openai library not installed. Install with: pip install openai")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx needs h2 for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 @dataclass
 class LLMResponse:
     """Standardized response from LLM services"""
@@ -84,10 +99,12 @@ class LLMService:
             'gpt-4o': {'input': 5.0, 'output': 15.0}
         }
         
-        # Response cache for identical requests
+        # Response cache for identical requests (guarded for concurrent callers)
         self.cache = {}
+        self.cache_lock = threading.Lock()
         self.cache_file = Path(__file__).parent.parent / "cache" / "llm_cache.json"
         self.load_cache()
+        self.stats_lock = threading.Lock()
         
     def setup_logging(self):
         """Setup logging for LLM service"""
@@ -96,6 +113,17 @@ class LLMService:
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         
+    def create_http_client(self):
+        """Pooled HTTP/2 keep-alive client for an SDK, or None to use the SDK default"""
+        if not HTTP2_AVAILABLE:
+            return None
+        
+        return httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            timeout=httpx.Timeout(600.0, connect=5.0)
+        )
+    
     def setup_clients(self):
         """Initialize LLM clients with API keys"""
         
@@ -113,7 +141,11 @@ class LLMService:
             claude_api_key = os.getenv('ANTHROPIC_API_KEY')
             if claude_api_key:
                 try:
-                    self.claude_client = anthropic.Anthropic(api_key=claude_api_key)
+                    http_client = self.create_http_client()
+                    if http_client:
+                        self.claude_client = anthropic.Anthropic(api_key=claude_api_key, http_client=http_client)
+                    else:
+                        self.claude_client = anthropic.Anthropic(api_key=claude_api_key)
                     self.logger.info("Claude API client initialized successfully")
                 except Exception as e:
                     self.logger.error(f"Failed to initialize Claude client: {e}")
@@ -125,7 +157,11 @@ class LLMService:
             openai_api_key = os.getenv('OPENAI_API_KEY')
             if openai_api_key:
                 try:
-                    self.openai_client = openai.OpenAI(api_key=openai_api_key)
+                    http_client = self.create_http_client()
+                    if http_client:
+                        self.openai_client = openai.OpenAI(api_key=openai_api_key, http_client=http_client)
+                    else:
+                        self.openai_client = openai.OpenAI(api_key=openai_api_key)
                     self.logger.info("OpenAI API client initialized successfully")
                 except Exception as e:
                     self.logger.error(f"Failed to initialize OpenAI client: {e}")
@@ -141,8 +177,11 @@ class LLMService:
         """Load response cache from file"""
         if self.cache_file.exists():
             try:
-                with open(self.cache_file, 'r') as f:
-                    self.cache = json.load(f)
+                if ORJSON_AVAILABLE:
+                    self.cache = orjson.loads(self.cache_file.read_bytes())
+                else:
+                    with open(self.cache_file, 'r') as f:
+                        self.cache = json.load(f)
                 self.logger.info(f"Loaded {len(self.cache)} cached responses")
             except Exception as e:
                 self.logger.error(f"Failed to load cache: {e}")
@@ -152,8 +191,12 @@ class LLMService:
         """Save response cache to file"""
         try:
             self.cache_file.parent.mkdir(exist_ok=True)
-            with open(self.cache_file, 'w') as f:
-                json.dump(self.cache, f)
+            # The whole cache is rewritten after every new response, so use orjson when available
+            if ORJSON_AVAILABLE:
+                self.cache_file.write_bytes(orjson.dumps(self.cache))
+            else:
+                with open(self.cache_file, 'w') as f:
+                    json.dump(self.cache, f)
         except Exception as e:
             self.logger.error(f"Failed to save cache: {e}")
     
@@ -199,24 +242,25 @@ class LLMService:
     
     def update_usage_stats(self, model: str, tokens: int, cost: float):
         """Update usage statistics"""
-        self.usage_stats.total_requests += 1
-        self.usage_stats.total_tokens += tokens
-        self.usage_stats.total_cost_usd += cost
-        
-        if model not in self.usage_stats.by_model:
-            self.usage_stats.by_model[model] = {
-                'requests': 0,
-                'tokens': 0,
-                'cost': 0.0
-            }
-        
-        self.usage_stats.by_model[model]['requests'] += 1
-        self.usage_stats.by_model[model]['tokens'] += tokens
-        self.usage_stats.by_model[model]['cost'] += cost
-        
-        # Save periodically
-        if self.usage_stats.total_requests % 10 == 0:
-            self.save_usage_stats()
+        with self.stats_lock:
+            self.usage_stats.total_requests += 1
+            self.usage_stats.total_tokens += tokens
+            self.usage_stats.total_cost_usd += cost
+            
+            if model not in self.usage_stats.by_model:
+                self.usage_stats.by_model[model] = {
+                    'requests': 0,
+                    'tokens': 0,
+                    'cost': 0.0
+                }
+            
+            self.usage_stats.by_model[model]['requests'] += 1
+            self.usage_stats.by_model[model]['tokens'] += tokens
+            self.usage_stats.by_model[model]['cost'] += cost
+            
+            # Save periodically
+            if self.usage_stats.total_requests % 10 == 0:
+                self.save_usage_stats()
     
     def call_claude(self, prompt: str, model: str = "claude-3-sonnet-20241022", max_tokens: int = 1500, temperature: float = 0.3) -> LLMResponse:
         """Call Claude API"""
@@ -378,23 +422,7 @@ class LLMService:
             temperature: Controls randomness (0.0-1.0, default 0.3)
         """
         
-        # Model selection prioritizes Claude 3.5 Haiku (best available Claude model)
-        if self.claude_client and not self.openai_client:
-            # User has Claude API - use Claude 3.5 Haiku (best available)
-            primary_model = "claude-3-5-haiku-20241022"
-            fallback_model = "claude-3-haiku-20240307"
-        elif self.openai_client and self.claude_client:
-            # Both available - prioritize Claude 3.5 Haiku, fallback to OpenAI
-            primary_model = "claude-3-5-haiku-20241022" 
-            fallback_model = "gpt-4o-mini"
-        elif self.openai_client and not self.claude_client:
-            # User has only OpenAI - use as backup
-            primary_model = "gpt-4o-mini"
-            fallback_model = "gpt-3.5-turbo"
-        else:
-            # No API keys - will fail gracefully
-            primary_model = "claude-3-5-haiku-20241022"
-            fallback_model = "gpt-4o-mini"
+        primary_model, fallback_model = self.select_models()
         
         # Check cache first
         if use_cache:
@@ -414,7 +442,37 @@ class LLMService:
         
         # Cache successful responses
         if response.success and use_cache:
-            cache_key = self.get_cache_key(prompt, response.model, max_tokens)
+            self.cache_response(prompt, max_tokens, response)
+        
+        return response
+    
+    def select_models(self) -> Tuple[str, str]:
+        """Primary and fallback model for the configured API clients"""
+        
+        # Model selection prioritizes Claude 3.5 Haiku (best available Claude model)
+        if self.claude_client and not self.openai_client:
+            # User has Claude API - use Claude 3.5 Haiku (best available)
+            primary_model = "claude-3-5-haiku-20241022"
+            fallback_model = "claude-3-haiku-20240307"
+        elif self.openai_client and self.claude_client:
+            # Both available - prioritize Claude 3.5 Haiku, fallback to OpenAI
+            primary_model = "claude-3-5-haiku-20241022" 
+            fallback_model = "gpt-4o-mini"
+        elif self.openai_client and not self.claude_client:
+            # User has only OpenAI - use as backup
+            primary_model = "gpt-4o-mini"
+            fallback_model = "gpt-3.5-turbo"
+        else:
+            # No API keys - will fail gracefully
+            primary_model = "claude-3-5-haiku-20241022"
+            fallback_model = "gpt-4o-mini"
+        
+        return primary_model, fallback_model
+    
+    def cache_response(self, prompt: str, max_tokens: int, response: LLMResponse):
+        """Store a successful response in the response cache"""
+        cache_key = self.get_cache_key(prompt, response.model, max_tokens)
+        with self.cache_lock:
             self.cache[cache_key] = {
                 'success': response.success,
                 'content': response.content,
@@ -424,9 +482,229 @@ class LLMService:
                 'execution_time': response.execution_time
             }
             self.save_cache()
+    
+    def stream_claude(self, prompt: str, model: str, max_tokens: int, temperature: float,
+                      on_chunk: Callable[[str], None]) -> LLMResponse:
+        """Stream a Claude response, passing each text chunk to on_chunk as it arrives"""
+        if not self.claude_client:
+            return LLMResponse(
+                success=False,
+                content="",
+                model=model,
+                tokens_used=0,
+                cost_usd=0.0,
+                execution_time=0.0,
+                error_message="Claude client not initialized"
+            )
+        
+        start_time = time.time()
+        chunks = []
+        
+        try:
+            with self.claude_client.messages.stream(
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    on_chunk(text)
+                final_message = stream.get_final_message()
+            
+            execution_time = time.time() - start_time
+            input_tokens = final_message.usage.input_tokens
+            output_tokens = final_message.usage.output_tokens
+            total_tokens = input_tokens + output_tokens
+            cost = self.calculate_cost(model, input_tokens, output_tokens)
+            
+            self.update_usage_stats(model, total_tokens, cost)
+            self.logger.info(f"Claude stream complete: {total_tokens} tokens, ${cost:.4f}")
+            
+            return LLMResponse(
+                success=True,
+                content="".join(chunks),
+                model=model,
+                tokens_used=total_tokens,
+                cost_usd=cost,
+                execution_time=execution_time
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Claude stream failed: {e}")
+            return LLMResponse(
+                success=False,
+                content="".join(chunks),
+                model=model,
+                tokens_used=0,
+                cost_usd=0.0,
+                execution_time=time.time() - start_time,
+                error_message=str(e)
+            )
+    
+    def stream_openai(self, prompt: str, model: str, max_tokens: int, temperature: float,
+                      on_chunk: Callable[[str], None]) -> LLMResponse:
+        """Stream an OpenAI response, passing each text chunk to on_chunk as it arrives"""
+        if not self.openai_client:
+            return LLMResponse(
+                success=False,
+                content="",
+                model=model,
+                tokens_used=0,
+                cost_usd=0.0,
+                execution_time=0.0,
+                error_message="OpenAI client not initialized"
+            )
+        
+        start_time = time.time()
+        chunks = []
+        usage = None
+        
+        try:
+            stream = self.openai_client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True,
+                stream_options={"include_usage": True}
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    text = chunk.choices[0].delta.content
+                    chunks.append(text)
+                    on_chunk(text)
+                if chunk.usage:
+                    usage = chunk.usage
+            
+            execution_time = time.time() - start_time
+            content = "".join(chunks)
+            
+            # Usage arrives in the final chunk; approximate if the server omitted it
+            prompt_tokens = usage.prompt_tokens if usage else len(prompt.split()) * 1.3
+            completion_tokens = usage.completion_tokens if usage else len(content.split()) * 1.3
+            total_tokens = int(prompt_tokens + completion_tokens)
+            cost = self.calculate_cost(model, int(prompt_tokens), int(completion_tokens))
+            
+            self.update_usage_stats(model, total_tokens, cost)
+            self.logger.info(f"OpenAI stream complete: {total_tokens} tokens, ${cost:.4f}")
+            
+            return LLMResponse(
+                success=True,
+                content=content,
+                model=model,
+                tokens_used=total_tokens,
+                cost_usd=cost,
+                execution_time=execution_time
+            )
+            
+        except Exception as e:
+            self.logger.error(f"OpenAI stream failed: {e}")
+            return LLMResponse(
+                success=False,
+                content="".join(chunks),
+                model=model,
+                tokens_used=0,
+                cost_usd=0.0,
+                execution_time=time.time() - start_time,
+                error_message=str(e)
+            )
+    
+    def stream_call_llm(self,
+                        prompt: str,
+                        on_chunk: Callable[[str], None],
+                        task_type: str = "general",
+                        use_cache: bool = True,
+                        max_tokens: int = 1500,
+                        temperature: float = 0.3) -> LLMResponse:
+        """
+        Streaming variant of call_llm
+        
+        Text is handed to on_chunk as soon as it is decoded, so callers can
+        write it out before generation finishes. The complete response is
+        returned and cached as with call_llm. A cached response is delivered
+        as a single chunk.
+        
+        Args:
+            prompt: The prompt to send
+            on_chunk: Called with each piece of generated text, in order
+            task_type: Type of task for model selection (analysis, generation, simple)
+            use_cache: Whether to use cached responses
+            max_tokens: Maximum tokens for response
+            temperature: Controls randomness (0.0-1.0, default 0.3)
+        """
+        
+        primary_model, fallback_model = self.select_models()
+        
+        if use_cache:
+            cache_key = self.get_cache_key(prompt, primary_model, max_tokens)
+            if cache_key in self.cache:
+                self.logger.info("Using cached response")
+                response = LLMResponse(**self.cache[cache_key])
+                on_chunk(response.content)
+                return response
+        
+        emitted = []
+        
+        def track_chunk(text: str):
+            emitted.append(text)
+            on_chunk(text)
+        
+        response = self.stream_claude(prompt, primary_model, max_tokens, temperature, track_chunk)
+        
+        # Only fall back if nothing reached the caller, otherwise output would be duplicated
+        if not response.success and not emitted and self.openai_client:
+            self.logger.warning("Claude failed, falling back to OpenAI")
+            response = self.stream_openai(prompt, fallback_model, max_tokens, temperature, track_chunk)
+        
+        if response.success and use_cache:
+            self.cache_response(prompt, max_tokens, response)
         
         return response
     
+    def batch_call_llm(self,
+                       prompts: List[str],
+                       task_types: Optional[List[str]] = None,
+                       use_cache: bool = True,
+                       max_tokens: Union[int, List[int]] = 1500,
+                       temperature: float = 0.3,
+                       max_workers: int = 8) -> List[LLMResponse]:
+        """
+        Run many independent LLM calls concurrently
+        
+        Each prompt goes through call_llm (cache, model routing, fallback) on a
+        worker thread, so N requests take roughly N / max_workers round-trips.
+        
+        Args:
+            prompts: Prompts to send
+            task_types: Task type per prompt (defaults to "general")
+            use_cache: Whether to use cached responses
+            max_tokens: Maximum tokens for every response, or one value per prompt
+            temperature: Controls randomness (0.0-1.0, default 0.3)
+            max_workers: Maximum number of requests in flight
+            
+        Returns:
+            Responses in the same order as prompts
+        """
+        
+        if not prompts:
+            return []
+        
+        task_types = task_types or ["general"] * len(prompts)
+        if isinstance(max_tokens, int):
+            max_tokens = [max_tokens] * len(prompts)
+        
+        if not len(prompts) == len(task_types) == len(max_tokens):
+            raise ValueError("prompts, task_types and max_tokens must have the same length")
+        
+        self.logger.info(f"Batch calling LLM with {len(prompts)} prompts")
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts))) as executor:
+            return list(executor.map(
+                lambda request: self.call_llm(request[0], request[1], use_cache, request[2], temperature),
+                zip(prompts, task_types, max_tokens)
+            ))
+    
     def get_usage_report(self) -> Dict:
         """Get detailed usage report"""
         return {
@@ -454,6 +732,16 @@ def call_llm(prompt: str, task_type: str = "general", use_cache: bool = True, ma
     """Convenience function for calling LLM"""
     return llm_service.call_llm(prompt, task_type, use_cache, max_tokens, temperature)
 
+def stream_call_llm(prompt: str, on_chunk: Callable[[str], None], task_type: str = "general", use_cache: bool = True,
+                    max_tokens: int = 1500, temperature: float = 0.3) -> LLMResponse:
+    """Convenience function for streaming an LLM response"""
+    return llm_service.stream_call_llm(prompt, on_chunk, task_type, use_cache, max_tokens, temperature)
+
+def batch_call_llm(prompts: List[str], task_types: Optional[List[str]] = None, use_cache: bool = True,
+                   max_tokens: Union[int, List[int]] = 1500, temperature: float = 0.3) -> List[LLMResponse]:
+    """Convenience function for calling LLM with many prompts concurrently"""
+    return llm_service.batch_call_llm(prompts, task_types, use_cache, max_tokens, temperature)
+
 def get_usage_report() -> Dict:
     """Get current usage statistics"""
     return llm_service.get_usage_report()
\ No newline at end of file
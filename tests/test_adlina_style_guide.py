@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Adlina style guide module
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import unittest
+from unittest import mock
+from modules.adlina_style_guide import AdlinaStyleGuide
+
+VALID_SUMMARY = ("Senior Product Manager with 6+ years scaling digital platforms serving 600,000+ users. "
+                 "Built AI-powered RAG system achieving 94% accuracy with sub-second response times. "
+                 "Led F&B platform scaling across 24 business parks, generating €20-22M annual GMV from "
+                 "1,330 to 30,000+ daily orders. Specialized in automation and enterprise integration, "
+                 "reducing contract activation from 42 days to 10 minutes and accelerating invoicing "
+                 "from 21 days to real-time through Salesforce-SAP integration for finance and operations teams.")
+VALID_BULLET = "• Reduced contract activation from 42 days to 10 minutes through Salesforce-SAP integration across 24 business parks"
+
+class TestSummaryValidation(unittest.TestCase):
+    def test_result_is_json_serializable(self):
+        """Test summary results are plain dicts that json.dumps accepts"""
+        result = AdlinaStyleGuide.validate_summary(VALID_SUMMARY)
+
+        self.assertIsInstance(result, dict)
+        self.assertTrue(result['is_valid'])
+        self.assertEqual(json.loads(json.dumps(result)), result)
+
+    def test_results_are_not_shared_between_calls(self):
+        """Test mutating one result does not change the next result for the same summary"""
+        first = AdlinaStyleGuide.validate_summary("Innovative leader")
+        first['issues'].append("edited by caller")
+        first['metrics_found']['years_experience'] = True
+
+        second = AdlinaStyleGuide.validate_summary("Innovative leader")
+        self.assertNotIn("edited by caller", second['issues'])
+        self.assertFalse(second['metrics_found']['years_experience'])
+
+    def test_every_call_is_logged(self):
+        """Test repeated summaries are logged even when the scan is cached"""
+        with mock.patch.object(AdlinaStyleGuide.logger, 'log_validation') as log_validation:
+            AdlinaStyleGuide.validate_summary(VALID_SUMMARY)
+            AdlinaStyleGuide.validate_summary(VALID_SUMMARY)
+
+        self.assertEqual(log_validation.call_count, 2)
+
+    def test_forbidden_words_reported(self):
+        """Test generic words make a summary invalid"""
+        result = AdlinaStyleGuide.validate_summary("Innovative and strategic leader with 6 years")
+
+        self.assertFalse(result['is_valid'])
+        self.assertIn("Contains generic words: innovative, strategic", result['issues'])
+
+class TestBulletValidation(unittest.TestCase):
+    def test_result_is_json_serializable(self):
+        """Test bullet results are plain dicts that json.dumps accepts"""
+        result = AdlinaStyleGuide.validate_bullet(VALID_BULLET)
+
+        self.assertIsInstance(result, dict)
+        self.assertTrue(result['is_valid'])
+        self.assertTrue(result['starts_with_action'])
+        self.assertTrue(result['has_metrics'])
+        self.assertEqual(json.loads(json.dumps(result)), result)
+
+    def test_results_are_not_shared_between_calls(self):
+        """Test mutating one bullet result does not change later results"""
+        AdlinaStyleGuide.validate_bullet(VALID_BULLET)['issues'].append("edited by caller")
+
+        self.assertEqual(AdlinaStyleGuide.validate_bullet(VALID_BULLET)['issues'], [])
+
+    def test_batch_matches_single_validation(self):
+        """Test validate_bullets gives the same result as validating each bullet alone"""
+        bullets = [
+            VALID_BULLET,
+            "- Built a robust pipeline",
+            "",
+            "Led innovative work",
+            "Managed scalable systems for 600 users",
+            "cutting-edge",
+        ]
+
+        self.assertEqual(AdlinaStyleGuide.validate_bullets(bullets),
+                         [AdlinaStyleGuide.validate_bullet(bullet) for bullet in bullets])
+
+    def test_forbidden_words_mapped_to_their_bullet(self):
+        """Test forbidden words at bullet edges are attributed to the right bullet"""
+        results = AdlinaStyleGuide.validate_bullets(["Built something robust", "dynamic systems", "Led teams"])
+
+        self.assertIn("Contains generic words: robust", results[0]['issues'])
+        self.assertIn("Contains generic words: dynamic", results[1]['issues'])
+        self.assertFalse(any('generic' in issue for issue in results[2]['issues']))
+
+    def test_words_do_not_join_across_bullets(self):
+        """Test the end of one bullet and the start of the next never form a forbidden word"""
+        results = AdlinaStyleGuide.validate_bullets(["Built cutting", "edge tools"])
+
+        self.assertFalse(any('generic' in issue for result in results for issue in result['issues']))
+
+    def test_empty_batch(self):
+        """Test validating no bullets returns an empty list"""
+        self.assertEqual(AdlinaStyleGuide.validate_bullets([]), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import unittest
 import tempfile
 import shutil
+import subprocess
 from pathlib import Path
 from main import JobApplicationGenerator
 
@@ -178,5 +179,13 @@ class TestIntegration(unittest.TestCase):
                 except Exception as e:
                     self.fail(f"Failed to generate for {country}: {str(e)}")
 
+    def test_piped_jd_requires_country(self):
+        """Test piping the JD without --country fails at argument parsing instead of at the menu"""
+        result = subprocess.run([sys.executable, "main.py"], input=self.ai_jd, capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        
+        self.assertEqual(result.returncode, 2)
+        self.assertIn("--country is required", result.stderr)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Unit tests for LLM-based JD analyzer module
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import llm_based_jd_analyzer
+from llm_based_jd_analyzer import StreamingFieldParser, close_shared_clients, get_shared_client
+
+class FakeAsyncOpenAI:
+    """Stands in for the SDK client, remembering whether it was closed"""
+
+    def __init__(self, **kwargs):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+class TestStreamingFieldParser(unittest.TestCase):
+    def setUp(self):
+        self.parser = StreamingFieldParser(("professional_summary", "experience_bullets", "positioning"))
+
+    def test_fields_reported_as_they_complete(self):
+        """Test each field is reported by the chunk that completes its value"""
+        self.assertEqual(self.parser.feed('{"professional_summary": "Senior PM'), [])
+        self.assertEqual(self.parser.feed(' with 6+ years", "experience_bullets": ["Built'),
+                         [("professional_summary", "Senior PM with 6+ years")])
+        self.assertEqual(self.parser.feed(' X", "Led Y"], '),
+                         [("experience_bullets", ["Built X", "Led Y"])])
+        self.assertEqual(self.parser.feed('"positioning": "Builder"}'), [("positioning", "Builder")])
+        self.assertEqual(self.parser.pending, {})
+
+    def test_key_split_across_chunks(self):
+        """Test a field name cut between two chunks is still found"""
+        self.assertEqual(self.parser.feed('{"position'), [])
+        self.assertEqual(self.parser.feed('ing" : "Builder"}'), [("positioning", "Builder")])
+
+    def test_field_reported_once(self):
+        """Test a completed field is not reported again by later chunks"""
+        self.parser.feed('{"positioning": "Builder", ')
+        self.assertEqual(self.parser.feed('"experience_bullets": []}'), [("experience_bullets", [])])
+
+    def test_escaped_field_name_inside_value_ignored(self):
+        """Test a quoted field name inside another value does not count as the field"""
+        completed = self.parser.feed('{"professional_summary": "Known for \\"positioning\\": clarity"')
+
+        self.assertEqual(completed, [("professional_summary", 'Known for "positioning": clarity')])
+        self.assertIn("positioning", self.parser.pending)
+
+    def test_values_and_buffer_kept(self):
+        """Test completed values and the raw text stay available after streaming"""
+        text = '{"positioning": "Builder", "experience_bullets": ["A"]}'
+        for chunk in (text[:10], text[10:30], text[30:]):
+            self.parser.feed(chunk)
+
+        self.assertEqual(self.parser.values, {"positioning": "Builder", "experience_bullets": ["A"]})
+        self.assertEqual(self.parser.getvalue(), text)
+        self.assertEqual(list(self.parser.pending), ["professional_summary"])
+
+class TestSharedClient(unittest.TestCase):
+    def setUp(self):
+        for name, value in (('OPENAI_AVAILABLE', True), ('HTTPX_AVAILABLE', False),
+                            ('AsyncOpenAI', FakeAsyncOpenAI)):
+            patcher = mock.patch.object(llm_based_jd_analyzer, name, value, create=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_client_shared_within_loop(self):
+        """Test analyzers on one event loop share a client per API key"""
+        async def clients():
+            return get_shared_client(), get_shared_client(), get_shared_client("other-key")
+
+        first, second, other = asyncio.run(clients())
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def test_client_not_shared_across_loops(self):
+        """Test each asyncio.run gets a client bound to its own loop"""
+        async def client():
+            return get_shared_client()
+
+        self.assertIsNot(asyncio.run(client()), asyncio.run(client()))
+
+    def test_close_on_owning_loop(self):
+        """Test closing shared clients closes them on their loop and drops them"""
+        async def close_and_reopen():
+            client = get_shared_client()
+            await close_shared_clients()
+            return client, get_shared_client()
+
+        closed, reopened = asyncio.run(close_and_reopen())
+        self.assertTrue(closed.closed)
+        self.assertIsNot(closed, reopened)
+        self.assertFalse(reopened.closed)
+
+    def test_entry_point_closes_shared_client(self):
+        """Test the shared client is closed once the analyzer call finishes, but not before"""
+        clients = []
+
+        @llm_based_jd_analyzer.closes_shared_clients
+        async def use_client(delay):
+            clients.append(get_shared_client())
+            await asyncio.sleep(delay)
+            return clients[-1].closed
+
+        async def overlapping_calls():
+            return await asyncio.gather(use_client(0), use_client(0.01))
+
+        self.assertEqual(asyncio.run(overlapping_calls()), [False, False])
+        self.assertIs(clients[0], clients[1])
+        self.assertTrue(clients[0].closed)
+
+    def test_analyzer_prefers_given_client(self):
+        """Test a client passed to the analyzer is used instead of the shared one"""
+        client = FakeAsyncOpenAI()
+        analyzer = llm_based_jd_analyzer.LLMJobDescriptionAnalyzer(client=client)
+
+        self.assertIs(analyzer.client, client)
+
+class FakeOpenAIClient:
+    """Answers completions with a fixed JSON object and counts embeddings requests"""
+
+    def __init__(self):
+        self.embedding_calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create_completion))
+        self.embeddings = SimpleNamespace(create=self.create_embedding)
+
+    async def create_completion(self, **kwargs):
+        message = SimpleNamespace(content=json.dumps({"role_domain": "Fintech"}))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def create_embedding(self, model, input):
+        self.embedding_calls += 1
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[1.0, 0.0])])
+
+class TestSemanticCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.client = FakeOpenAIClient()
+
+    def make_analyzer(self, **kwargs):
+        analyzer = llm_based_jd_analyzer.LLMJobDescriptionAnalyzer(client=self.client, **kwargs)
+        analyzer.cache_dir = Path(self.temp_dir.name)
+        return analyzer
+
+    def test_cache_miss_embeds_and_indexes(self):
+        """Test a new JD is embedded once and added to the semantic index"""
+        analyzer = self.make_analyzer()
+        asyncio.run(analyzer.analyze_combined("Payments PM"))
+
+        self.assertEqual(self.client.embedding_calls, 1)
+        self.assertEqual(len(analyzer.load_semantic_index()), 1)
+
+    def test_force_refresh_skips_embedding(self):
+        """Test a forced refresh makes no embeddings call"""
+        analyzer = self.make_analyzer()
+        result = asyncio.run(analyzer.analyze_combined("Payments PM", force_refresh=True))
+
+        self.assertEqual(result["role_domain"], "Fintech")
+        self.assertEqual(self.client.embedding_calls, 0)
+
+    def test_disabled_semantic_cache_skips_embedding(self):
+        """Test semantic_cache=False makes no embeddings call and leaves the index empty"""
+        analyzer = self.make_analyzer(semantic_cache=False)
+        asyncio.run(analyzer.analyze_combined("Payments PM"))
+
+        self.assertEqual(self.client.embedding_calls, 0)
+        self.assertEqual(analyzer.load_semantic_index(), [])
+
+COMBINED_RESULT = {"role_domain": "Fintech", "professional_summary": "Payments PM",
+                   "experience_bullets": ["Built X"], "technical_skills": ["APIs"],
+                   "business_skills": ["Strategy"], "positioning": "Builder"}
+
+class FakeBatchClient(FakeOpenAIClient):
+    """Runs Batch API jobs immediately, answering every request with COMBINED_RESULT"""
+
+    def __init__(self):
+        super().__init__()
+        self.completion_calls = 0
+        self.requests = []
+        self.files = SimpleNamespace(create=self.create_file, content=self.file_content)
+        self.batches = SimpleNamespace(create=self.create_batch)
+
+    async def create_completion(self, **kwargs):
+        self.completion_calls += 1
+        message = SimpleNamespace(content=json.dumps(COMBINED_RESULT))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def create_file(self, file, purpose):
+        self.requests = [json.loads(line) for line in file[1].decode("utf-8").splitlines()]
+        return SimpleNamespace(id="input")
+
+    async def create_batch(self, **kwargs):
+        return SimpleNamespace(id="batch", status="completed", output_file_id="output")
+
+    async def file_content(self, file_id):
+        lines = [json.dumps({"custom_id": request["custom_id"], "response": {"body": {"choices": [
+                    {"message": {"content": json.dumps(COMBINED_RESULT)}}]}}})
+                 for request in self.requests]
+        return SimpleNamespace(text="\n".join(lines))
+
+class TestBatchAnalysis(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.client = FakeBatchClient()
+        self.analyzer = llm_based_jd_analyzer.LLMJobDescriptionAnalyzer(client=self.client, semantic_cache=False)
+        self.analyzer.cache_dir = Path(self.temp_dir.name)
+
+    def test_batch_submits_combined_prompt(self):
+        """Test batch requests use the combined prompt and schema"""
+        asyncio.run(self.analyzer.analyze_job_descriptions_batch(["JD one", "JD two"], poll_interval=0))
+
+        body = self.client.requests[0]["body"]
+        self.assertEqual(body["response_format"], llm_based_jd_analyzer.COMBINED_RESPONSE_FORMAT)
+        self.assertEqual(body["messages"][1]["content"], self.analyzer.build_combined_prompt("JD one"))
+
+    def test_batch_results_shared_with_realtime_path(self):
+        """Test a batched JD is a cache hit for analyze_job_description and needs no content call"""
+        analyses = asyncio.run(self.analyzer.analyze_job_descriptions_batch(["JD one", "JD two"], poll_interval=0))
+        self.assertEqual([analysis["role_domain"] for analysis in analyses], ["Fintech", "Fintech"])
+        self.assertNotIn("professional_summary", analyses[0])
+
+        async def realtime():
+            analysis = await self.analyzer.analyze_job_description("JD one")
+            return await self.analyzer.generate_dynamic_resume_content(analysis)
+
+        content = asyncio.run(realtime())
+        self.assertEqual(content["professional_summary"], "Payments PM")
+        self.assertEqual(self.client.completion_calls, 0)
+
+class TestFusedContent(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.client = FakeBatchClient()
+        self.analyzer = llm_based_jd_analyzer.LLMJobDescriptionAnalyzer(client=self.client, semantic_cache=False)
+        self.analyzer.cache_dir = Path(self.temp_dir.name)
+
+    def test_caller_edits_do_not_leak(self):
+        """Test editing returned analyses and content does not change later results"""
+        async def edit_then_reload():
+            analysis, content = await self.analyzer.analyze_and_generate("JD one")
+            content["experience_bullets"].append("edited by caller")
+            analysis["role_domain"] = "edited by caller"
+            reused = await self.analyzer.generate_dynamic_resume_content(
+                {**analysis, "role_domain": "Fintech"})
+            reused["experience_bullets"].append("edited again")
+            return (await self.analyzer.analyze_and_generate("JD one"),
+                    await self.analyzer.generate_dynamic_resume_content(
+                        await self.analyzer.analyze_job_description("JD one")))
+
+        (analysis, content), reused = asyncio.run(edit_then_reload())
+        self.assertEqual(analysis["role_domain"], "Fintech")
+        self.assertEqual(content["experience_bullets"], ["Built X"])
+        self.assertEqual(reused["experience_bullets"], ["Built X"])
+        self.assertEqual(self.client.completion_calls, 1)
+
+    def test_fused_content_is_bounded(self):
+        """Test only the most recently used fused content entries are kept"""
+        with mock.patch.object(llm_based_jd_analyzer, 'FUSED_CONTENT_LIMIT', 2):
+            for domain in ("A", "B", "C"):
+                self.analyzer.split_combined({**COMBINED_RESULT, "role_domain": domain})
+
+        self.assertEqual(len(self.analyzer.fused_content), 2)
+        self.assertNotIn(self.analyzer.analysis_key({"role_domain": "A"}), self.analyzer.fused_content)
+
+    def test_analysis_key_independent_of_orjson(self):
+        """Test non-ASCII analyses get the same key whether or not orjson is installed"""
+        analysis = {"role_domain": "Zahlungsverkehr für Händler", "role_focus": "Café payments"}
+        keys = []
+        for available in (True, False):
+            with mock.patch.object(llm_based_jd_analyzer, 'ORJSON_AVAILABLE', available):
+                keys.append(self.analyzer.analysis_key(analysis))
+
+        self.assertEqual(keys[0], keys[1])
+        self.assertEqual(keys[0], self.analyzer.get_cache_key(json.dumps(analysis, sort_keys=True)))
+
+if __name__ == '__main__':
+    unittest.main()
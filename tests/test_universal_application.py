@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Unit tests for generate_universal_application module
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import subprocess
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import generate_universal_application as gua
+
+class FakeLLMService:
+    """Records prompts and answers each one with a letter naming its company"""
+
+    def __init__(self):
+        self.calls = []
+
+    def call_llm(self, prompt, task_type="general", **kwargs):
+        self.calls.append(task_type)
+        company = task_type.rsplit('_', 2)[0]
+        return SimpleNamespace(success=True, error_message=None,
+                               content=f"What draws me to {company}: your mission")
+
+class RecordingHandler(gua.logging.Handler):
+    """Keeps the message of every record that reaches it"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+class TestCompanySpecificProse(unittest.TestCase):
+    def setUp(self):
+        self.llm_service = FakeLLMService()
+        patcher = mock.patch.object(gua, 'get_llm_service', return_value=self.llm_service)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cover_letters_are_not_reused_across_companies(self):
+        """Test each company's cover letter comes from its own LLM call"""
+        pleo = gua.create_universal_jd_analysis("Pleo", "Product Manager", "Copenhagen", "")
+        spotify = gua.create_universal_jd_analysis("Spotify", "Data Scientist", "Stockholm", "")
+
+        pleo_letter = gua.generate_universal_cover_letter(pleo, "denmark")
+        spotify_letter = gua.generate_universal_cover_letter(spotify, "sweden")
+
+        self.assertEqual(self.llm_service.calls, ["pleo_cover_letter", "spotify_cover_letter"])
+        self.assertIn("pleo", pleo_letter)
+        self.assertIn("spotify", spotify_letter)
+        self.assertNotIn("pleo", spotify_letter)
+
+    def test_emails_are_not_reused_across_companies(self):
+        """Test each company's email comes from its own LLM call"""
+        pleo = gua.create_universal_jd_analysis("Pleo", "Product Manager", "Copenhagen", "")
+        spotify = gua.create_universal_jd_analysis("Spotify", "Data Scientist", "Stockholm", "")
+
+        gua.generate_universal_email(pleo)
+        spotify_email = gua.generate_universal_email(spotify)
+
+        self.assertEqual(self.llm_service.calls, ["pleo_email", "spotify_email"])
+        self.assertNotIn("pleo", spotify_email)
+
+class TestConfigureLogging(unittest.TestCase):
+    def setUp(self):
+        for name, value in (('_log_listener', None), ('logger', mock.Mock())):
+            patcher = mock.patch.object(gua, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(gua.logging.handlers, 'QueueListener')
+        self.listener = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(gua.atexit, 'register')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_import_has_no_side_effects(self):
+        """Test importing with a bad APLY_LOG_LEVEL neither raises nor starts a thread"""
+        code = ("import threading, generate_universal_application as gua; "
+                "assert threading.active_count() == 1 and not gua.logger.handlers")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                env={**os.environ, 'APLY_LOG_LEVEL': 'verbose'})
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_unknown_level_falls_back_to_info(self):
+        """Test an invalid APLY_LOG_LEVEL configures INFO and warns instead of raising"""
+        with mock.patch.dict(os.environ, {'APLY_LOG_LEVEL': 'verbose'}):
+            gua.configure_logging()
+
+        gua.logger.setLevel.assert_called_once_with(gua.logging.INFO)
+        gua.logger.warning.assert_called_once()
+
+    def test_valid_level_used(self):
+        """Test a known APLY_LOG_LEVEL is applied"""
+        with mock.patch.dict(os.environ, {'APLY_LOG_LEVEL': 'warning'}):
+            gua.configure_logging()
+
+        gua.logger.setLevel.assert_called_once_with(gua.logging.WARNING)
+        gua.logger.warning.assert_not_called()
+
+    def test_configured_once(self):
+        """Test repeated calls start a single listener"""
+        gua.configure_logging()
+        gua.configure_logging()
+
+        self.listener.assert_called_once()
+
+class TestResumeGenerator(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch('modules.enhanced_fact_aware_generator.EnhancedFactAwareGenerator',
+                             side_effect=lambda **kwargs: object())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(gua, '_resume_generators', threading.local())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_generator_reused_within_thread(self):
+        """Test one thread keeps getting the same generator"""
+        self.assertIs(gua.get_resume_generator(), gua.get_resume_generator())
+
+    def test_generator_not_shared_across_threads(self):
+        """Test concurrent workers get their own generator and validator state"""
+        generators = []
+        worker = threading.Thread(target=lambda: generators.append(gua.get_resume_generator()))
+        worker.start()
+        worker.join()
+
+        self.assertIsNot(generators[0], gua.get_resume_generator())
+
+class TestPackageReuse(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.output_dir = Path(self.temp_dir.name)
+        patcher = mock.patch.object(gua, 'PACKAGE_INDEX_FILE', self.output_dir / ".sig_index.json")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.signature = gua.package_signature("Spotify", "Data Scientist", "Stockholm",
+                                               "sweden", "JD text", ["SQL"])
+
+    def make_package(self, complete: bool = True) -> str:
+        package_dir = self.output_dir / "Spotify_package"
+        package_dir.mkdir()
+        files = gua.required_package_files("Spotify")
+        for name in files if complete else files[:-1]:
+            (package_dir / name).write_text("content")
+        return str(package_dir)
+
+    def test_signature_depends_on_every_input(self):
+        """Test a change to any input gives a different signature"""
+        self.assertEqual(self.signature, gua.package_signature("Spotify", "Data Scientist", "Stockholm",
+                                                               "sweden", "JD text", ["SQL"]))
+        variants = [
+            ("Pleo", "Data Scientist", "Stockholm", "sweden", "JD text", ["SQL"]),
+            ("Spotify", "Product Manager", "Stockholm", "sweden", "JD text", ["SQL"]),
+            ("Spotify", "Data Scientist", "London", "sweden", "JD text", ["SQL"]),
+            ("Spotify", "Data Scientist", "Stockholm", "uk", "JD text", ["SQL"]),
+            ("Spotify", "Data Scientist", "Stockholm", "sweden", "Other JD", ["SQL"]),
+            ("Spotify", "Data Scientist", "Stockholm", "sweden", "JD text", None),
+        ]
+        for variant in variants:
+            self.assertNotEqual(self.signature, gua.package_signature(*variant))
+
+    def test_complete_package_is_found(self):
+        """Test a recorded complete package is returned for its signature"""
+        package_dir = self.make_package()
+        gua.record_package(self.signature, package_dir)
+
+        self.assertEqual(gua.find_existing_package(self.signature, "Spotify"), package_dir)
+        self.assertIsNone(gua.find_existing_package("other", "Spotify"))
+
+    def test_incomplete_package_is_ignored(self):
+        """Test a package missing a required file is not reused"""
+        gua.record_package(self.signature, self.make_package(complete=False))
+
+        self.assertIsNone(gua.find_existing_package(self.signature, "Spotify"))
+
+    def generate(self, **kwargs) -> str:
+        documents = mock.AsyncMock(return_value=(None, None, None, None))
+        saved = mock.AsyncMock(return_value="new_package")
+        with mock.patch.object(gua, 'generate_package_documents', documents), \
+                mock.patch.object(gua, 'save_universal_package_async', saved):
+            return asyncio.run(gua.generate_application_for_company_async(
+                "Spotify", "Data Scientist", "Stockholm", "sweden", "JD text", ["SQL"], **kwargs))
+
+    def test_existing_package_reused_by_default(self):
+        """Test generation returns the existing package for identical inputs"""
+        package_dir = self.make_package()
+        gua.record_package(self.signature, package_dir)
+
+        self.assertEqual(self.generate(), package_dir)
+
+    def test_existing_package_bypassed_without_cache(self):
+        """Test use_cache=False and force=True both regenerate the package"""
+        gua.record_package(self.signature, self.make_package())
+
+        self.assertEqual(self.generate(use_cache=False), "new_package")
+        self.assertEqual(self.generate(force=True), "new_package")
+
+class TestBulkQuiet(unittest.TestCase):
+    def setUp(self):
+        self.handler = RecordingHandler()
+        gua.logger.addHandler(self.handler)
+        self.addCleanup(gua.logger.removeHandler, self.handler)
+        patcher = mock.patch.object(gua.logger, 'level', gua.logging.INFO)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for name in ('get_llm_service', 'get_user_data', 'get_linkedin_generator', 'prefetch_bulk_documents'):
+            patcher = mock.patch.object(gua, name)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def run_alongside_bulk(self, verbose):
+        async def generate(company, **kwargs):
+            def in_thread():
+                gua.logger.info(f"progress {company}")
+                gua.logger.warning(f"warning {company}")
+            await asyncio.to_thread(in_thread)
+            return company
+
+        async def other_caller():
+            await asyncio.sleep(0)
+            gua.logger.info("other caller")
+
+        async def run():
+            return await asyncio.gather(
+                gua.generate_applications_bulk([{"company": "Pleo"}], verbose=verbose),
+                other_caller())
+
+        with mock.patch.object(gua, 'generate_application_for_company_async', side_effect=generate):
+            results, _ = asyncio.run(run())
+        return results
+
+    def test_quiet_run_keeps_warnings_and_other_callers(self):
+        """Test a quiet bulk run drops only its own progress and never changes the logger level"""
+        self.assertEqual(self.run_alongside_bulk(verbose=False), ["Pleo"])
+
+        self.assertEqual(sorted(self.handler.messages), ["other caller", "warning Pleo"])
+        self.assertEqual(gua.logger.level, gua.logging.INFO)
+
+    def test_verbose_run_keeps_progress(self):
+        """Test verbose=True keeps the bulk run's progress messages"""
+        self.run_alongside_bulk(verbose=True)
+
+        self.assertIn("progress Pleo", self.handler.messages)
+
+if __name__ == '__main__':
+    unittest.main()